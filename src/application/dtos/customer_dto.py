@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerDTO:
     id: Optional[UUID] = None
     name: str = ""
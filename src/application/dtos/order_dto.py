@@ -1,10 +1,12 @@
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
+from src.application.dtos.order_item_dto import OrderItemDTO
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DeliveryAddressDTO:
     street: str = ""
     city: str = ""
@@ -15,18 +17,18 @@ class DeliveryAddressDTO:
     instructions: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderTotalDTO:
     subtotal: float = 0.0
     tax: float = 0.0
     total: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderDTO:
     id: Optional[UUID] = None
     customer_id: Optional[UUID] = None
-    items: List[Dict] = None
+    items: List[OrderItemDTO] = None
     status: str = "CREATED"
     delivery_address: Optional[DeliveryAddressDTO] = None
     total: Optional[OrderTotalDTO] = None
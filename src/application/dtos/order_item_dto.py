@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItemDTO:
     id: Optional[UUID] = None
     product_id: Optional[UUID] = None
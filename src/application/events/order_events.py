@@ -1,36 +1,57 @@
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
-from uuid import UUID
+import sys
+from typing import ClassVar, List, Optional
+from uuid import UUID, uuid4
 from datetime import datetime
-from uuid import uuid4
 
-@dataclass(kw_only=True)
-class Event:
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.entities.order_item import OrderItem
+
+
+class Event(BaseModel):
     """Base event class"""
+    model_config = ConfigDict(frozen=True)
+
     event_id: UUID
     event_type: str
     timestamp: datetime
     version: str = "1.0"
 
+    def to_bytes(self) -> bytes:
+        """Serialize the event straight to JSON bytes with pydantic-core"""
+        return self.__pydantic_serializer__.to_json(self)
+
+
+class OrderItemPayload(BaseModel):
+    """Order item as carried by order events, read directly from OrderItem attributes"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: UUID
+    product_id: UUID
+    name: str
+    quantity: int
+    unit_price: float
+    total_price: float
+
 
-@dataclass
 class OrderCreatedEvent(Event):
     """Event emitted when an order is created"""
-    order_id: str
-    customer_id: str
-    items: List[Dict[str, Any]]
+    EVENT_TYPE: ClassVar[str] = sys.intern("order.created")
+
+    order_id: UUID
+    customer_id: UUID
+    items: List[OrderItemPayload]
     total_amount: float
     status: str
     
-    @staticmethod
-    def create(order_id: str, customer_id: str, items: List[Dict[str, Any]], 
+    @classmethod
+    def create(cls, order_id: UUID, customer_id: UUID, items: List[OrderItem], 
               total_amount: float, status: str) -> "OrderCreatedEvent":
-        
-        return OrderCreatedEvent(
-            event_id=str(uuid4()),
-            event_type="order.created",
-            timestamp=str(datetime.now()),
-            order_id=str(order_id),
+        return cls(
+            event_id=uuid4(),
+            event_type=cls.EVENT_TYPE,
+            timestamp=datetime.now(),
+            order_id=order_id,
             customer_id=customer_id,
             items=items,
             total_amount=total_amount,
@@ -38,65 +59,64 @@ class OrderCreatedEvent(Event):
         )
 
 
-@dataclass
 class OrderConfirmedEvent(Event):
     """Event emitted when an order is confirmed"""
-    order_id: str
-    customer_id: str
+    EVENT_TYPE: ClassVar[str] = sys.intern("order.confirmed")
+
+    order_id: UUID
+    customer_id: UUID
     total_amount: float
     
-    @staticmethod
-    def create(order_id: str, customer_id: str, total_amount: float) -> "OrderConfirmedEvent":
-        from uuid import uuid4
-        
-        return OrderConfirmedEvent(
-            event_id=str(uuid4()),
-            event_type="order.confirmed",
-            timestamp=str(datetime.now()),
+    @classmethod
+    def create(cls, order_id: UUID, customer_id: UUID, total_amount: float) -> "OrderConfirmedEvent":
+        return cls(
+            event_id=uuid4(),
+            event_type=cls.EVENT_TYPE,
+            timestamp=datetime.now(),
             order_id=order_id,
             customer_id=customer_id,
             total_amount=total_amount
         )
 
 
-@dataclass
 class OrderCancelledEvent(Event):
     """Event emitted when an order is cancelled"""
-    order_id: str
-    customer_id: str
+    EVENT_TYPE: ClassVar[str] = sys.intern("order.cancelled")
+
+    order_id: UUID
+    customer_id: UUID
     reason: Optional[str] = None
     
-    @staticmethod
-    def create(order_id: str, customer_id: str, reason: Optional[str] = None) -> "OrderCancelledEvent":
-        from uuid import uuid4
-        
-        return OrderCancelledEvent(
-            event_id=str(uuid4()),
-            event_type="order.cancelled",
-            timestamp=str(datetime.now()),
+    @classmethod
+    def create(cls, order_id: UUID, customer_id: UUID, reason: Optional[str] = None) -> "OrderCancelledEvent":
+        return cls(
+            event_id=uuid4(),
+            event_type=cls.EVENT_TYPE,
+            timestamp=datetime.now(),
             order_id=order_id,
             customer_id=customer_id,
             reason=reason
         )
 
 
-@dataclass
 class OrderStatusUpdatedEvent(Event):
     """Event emitted when an order status is updated"""
-    order_id: str
-    customer_id: str
+    EVENT_TYPE: ClassVar[str] = sys.intern("order.status_updated")
+
+    order_id: UUID
+    customer_id: UUID
     previous_status: str
     new_status: str
     
-    @staticmethod
-    def create(order_id: str, customer_id: str, 
+    @classmethod
+    def create(cls, order_id: UUID, customer_id: UUID, 
               previous_status: str, new_status: str) -> "OrderStatusUpdatedEvent":
         
         
-        return OrderStatusUpdatedEvent(
-            event_id=str(uuid4()),
-            event_type="order.status_updated",
-            timestamp=str(datetime.now()),
+        return cls(
+            event_id=uuid4(),
+            event_type=cls.EVENT_TYPE,
+            timestamp=datetime.now(),
             order_id=order_id,
             customer_id=customer_id,
             previous_status=previous_status,
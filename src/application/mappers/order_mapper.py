@@ -1,5 +1,6 @@
-from typing import List, Optional
-from uuid import UUID
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
@@ -11,6 +12,37 @@ from src.application.dtos.order_item_dto import OrderItemDTO
 from src.application.dtos.customer_dto import CustomerDTO
 
 
+# Plain lookup instead of going through the Enum.value descriptor on every mapping
+_STATUS_STR = {order_status: order_status.value for order_status in OrderStatus}
+
+
+# Delivery addresses are immutable on both sides, so equal addresses can share one instance
+@lru_cache(maxsize=1024)
+def _delivery_address_to_entity(address_dto: DeliveryAddressDTO) -> DeliveryAddress:
+    return DeliveryAddress(
+        street=address_dto.street,
+        city=address_dto.city,
+        state=address_dto.state,
+        postal_code=address_dto.postal_code,
+        country=address_dto.country,
+        apartment=address_dto.apartment,
+        instructions=address_dto.instructions
+    )
+
+
+@lru_cache(maxsize=1024)
+def _delivery_address_to_dto(address: DeliveryAddress) -> DeliveryAddressDTO:
+    return DeliveryAddressDTO(
+        street=address.street,
+        city=address.city,
+        state=address.state,
+        postal_code=address.postal_code,
+        country=address.country,
+        apartment=address.apartment,
+        instructions=address.instructions
+    )
+
+
 class OrderMapper:
     @staticmethod
     def to_entity(order_dto: OrderDTO) -> Order:
@@ -18,33 +50,10 @@ class OrderMapper:
         Map OrderDTO to Order entity
         """
         # Map items
-        items = []
-        if order_dto.items:
-            for item_dict in order_dto.items:
-                item = OrderItem(
-                    id=item_dict.get("id") or UUID(item_dict.get("id")) if item_dict.get("id") else None,
-                    product_id=UUID(item_dict.get("product_id")),
-                    name=item_dict.get("name"),
-                    quantity=item_dict.get("quantity"),
-                    unit_price=item_dict.get("unit_price"),
-                    total_price=item_dict.get("total_price", item_dict.get("quantity", 0) * item_dict.get("unit_price", 0)),
-                    notes=item_dict.get("notes"),
-                    created_at=item_dict.get("created_at")
-                )
-                items.append(item)
+        items = [OrderMapper.order_item_to_entity(item_dto) for item_dto in order_dto.items] if order_dto.items else []
         
         # Map delivery address
-        delivery_address = None
-        if order_dto.delivery_address:
-            delivery_address = DeliveryAddress(
-                street=order_dto.delivery_address.street,
-                city=order_dto.delivery_address.city,
-                state=order_dto.delivery_address.state,
-                postal_code=order_dto.delivery_address.postal_code,
-                country=order_dto.delivery_address.country,
-                apartment=order_dto.delivery_address.apartment,
-                instructions=order_dto.delivery_address.instructions
-            )
+        delivery_address = _delivery_address_to_entity(order_dto.delivery_address) if order_dto.delivery_address else None
         
         # Map total
         total = OrderTotal(
@@ -55,7 +64,7 @@ class OrderMapper:
         
         # Create order
         return Order(
-            id=order_dto.id if order_dto.id else UUID(),
+            id=order_dto.id if order_dto.id else uuid4(),
             customer_id=order_dto.customer_id,
             items=items,
             status=OrderStatus(order_dto.status) if order_dto.status else OrderStatus.CREATED,
@@ -72,32 +81,10 @@ class OrderMapper:
         Map Order entity to OrderDTO
         """
         # Map items
-        items = []
-        for item in order.items:
-            item_dict = {
-                "id": str(item.id),
-                "product_id": str(item.product_id),
-                "name": item.name,
-                "quantity": item.quantity,
-                "unit_price": item.unit_price,
-                "total_price": item.total_price,
-                "notes": item.notes,
-                "created_at": item.created_at.isoformat() if item.created_at else None
-            }
-            items.append(item_dict)
+        items = [OrderMapper.order_item_to_dto(item) for item in order.items]
         
         # Map delivery address
-        delivery_address = None
-        if order.delivery_address:
-            delivery_address = DeliveryAddressDTO(
-                street=order.delivery_address.street,
-                city=order.delivery_address.city,
-                state=order.delivery_address.state,
-                postal_code=order.delivery_address.postal_code,
-                country=order.delivery_address.country,
-                apartment=order.delivery_address.apartment,
-                instructions=order.delivery_address.instructions
-            )
+        delivery_address = _delivery_address_to_dto(order.delivery_address) if order.delivery_address else None
         
         # Map total
         total = OrderTotalDTO(
@@ -111,7 +98,7 @@ class OrderMapper:
             id=order.id,
             customer_id=order.customer_id,
             items=items,
-            status=order.status.value,
+            status=_STATUS_STR[order.status],
             delivery_address=delivery_address,
             total=total,
             notes=order.notes,
@@ -119,6 +106,49 @@ class OrderMapper:
             updated_at=order.updated_at
         )
     
+    @staticmethod
+    def to_primitive(order: Order) -> Dict[str, Any]:
+        """
+        Map Order entity straight to a response dictionary, without building DTOs
+        """
+        delivery_address = order.delivery_address
+        total = order.total
+        return {
+            "id": order.id,
+            "customer_id": order.customer_id,
+            "items": [
+                {
+                    "id": item.id,
+                    "product_id": item.product_id,
+                    "name": item.name,
+                    "quantity": item.quantity,
+                    "unit_price": item.unit_price,
+                    "total_price": item.total_price,
+                    "notes": item.notes,
+                    "created_at": item.created_at
+                }
+                for item in order.items
+            ],
+            "status": _STATUS_STR[order.status],
+            "delivery_address": {
+                "street": delivery_address.street,
+                "city": delivery_address.city,
+                "state": delivery_address.state,
+                "postal_code": delivery_address.postal_code,
+                "country": delivery_address.country,
+                "apartment": delivery_address.apartment,
+                "instructions": delivery_address.instructions
+            } if delivery_address else None,
+            "total": {
+                "subtotal": total.subtotal,
+                "tax": total.tax,
+                "total": total.total
+            } if total else None,
+            "notes": order.notes,
+            "created_at": order.created_at,
+            "updated_at": order.updated_at
+        }
+    
     @staticmethod
     def customer_to_dto(customer: Customer) -> CustomerDTO:
         """
@@ -139,7 +169,7 @@ class OrderMapper:
         Map CustomerDTO to Customer entity
         """
         return Customer(
-            id=customer_dto.id if customer_dto.id else UUID(),
+            id=customer_dto.id if customer_dto.id else uuid4(),
             name=customer_dto.name,
             email=customer_dto.email,
             phone=customer_dto.phone,
@@ -169,7 +199,7 @@ class OrderMapper:
         Map OrderItemDTO to OrderItem entity
         """
         return OrderItem(
-            id=order_item_dto.id if order_item_dto.id else UUID(),
+            id=order_item_dto.id if order_item_dto.id else uuid4(),
             product_id=order_item_dto.product_id,
             name=order_item_dto.name,
             quantity=order_item_dto.quantity,
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -20,19 +20,31 @@ class OrderQueryService(OrderQueryPort):
         
         return order
     
-    async def get_orders_by_customer_id(self, customer_id: UUID) -> List[Order]:
-        """Get all orders from a customer"""
-        return await self.order_repository.find_by_customer_id(customer_id)
+    def get_orders_by_customer_id(
+        self,
+        customer_id: UUID,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream a page of orders from a customer, newest first"""
+        return self.order_repository.find_by_customer_id(customer_id, limit, cursor)
     
-    async def get_orders_by_status(self, status: OrderStatus) -> List[Order]:
-        """Get all orders with a specific status"""
-        return await self.order_repository.find_by_status(status)
+    def get_orders_by_status(
+        self,
+        status: OrderStatus,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream a page of orders with a specific status, newest first"""
+        return self.order_repository.find_by_status(status, limit, cursor)
     
-    async def get_orders_by_date_range(
+    def get_orders_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
-        status: Optional[OrderStatus] = None
-    ) -> List[Order]:
-        """Get all orders within a date range, optionally filtered by status"""
-        return await self.order_repository.find_by_date_range(start_date, end_date, status)
\ No newline at end of file
+        status: Optional[OrderStatus] = None,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream a page of orders within a date range, oldest first, optionally filtered by status"""
+        return self.order_repository.find_by_date_range(start_date, end_date, status, limit, cursor)
\ No newline at end of file
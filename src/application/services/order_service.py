@@ -1,11 +1,12 @@
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional
 from uuid import UUID
+from datetime import datetime
 
 from src.domain.ports.input.order_service_port import OrderServicePort
 from src.domain.ports.output.order_repository_port import OrderRepositoryPort
 from src.domain.ports.output.inventory_service_port import InventoryServicePort
 from src.domain.ports.output.event_publisher_port import EventPublisherPort
-from src.domain.entities.order import Order, OrderStatus
+from src.domain.entities.order import MUTABLE_STATUSES, Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
 from src.domain.value_objects.delivery_address import DeliveryAddress
 from src.domain.exceptions.domain_exceptions import (
@@ -18,6 +19,7 @@ from src.application.events.order_events import (
     OrderCreatedEvent,
     OrderConfirmedEvent,
     OrderCancelledEvent,
+    Event,
     OrderStatusUpdatedEvent
 )
 
@@ -33,23 +35,59 @@ class OrderService(OrderServicePort):
         self.inventory_service = inventory_service
         self.event_publisher = event_publisher
     
+    async def _load_order(self, order_id: UUID) -> Order:
+        """Get an order from the repository, failing if it does not exist"""
+        order = await self.order_repository.find_by_id(order_id)
+        if not order:
+            raise OrderNotFoundException(f"Order with ID {order_id} not found")
+        return order
+    
+    async def _mutate_and_publish(
+        self,
+        order_id: UUID,
+        mutate: Callable[[Order], None],
+        build_event: Callable[[Order, str], Event]
+    ) -> Order:
+        """Load an order, apply a mutation, persist it and publish the resulting event"""
+        order = await self._load_order(order_id)
+        
+        # Track previous status for the event
+        previous_status = order.status
+        
+        mutate(order)
+        # Nothing to persist or publish when the status did not change
+        if order.status is previous_status:
+            return order
+        
+        updated_order = await self.order_repository.update(order)
+        
+        event = build_event(updated_order, previous_status.value)
+        await self.event_publisher.publish_event(
+            event_type=event.event_type,
+            payload=event.to_bytes(),
+            key=updated_order.id
+        )
+        
+        return updated_order
+    
     async def create_order(
         self,
         customer_id: UUID,
         items: List[OrderItem],
         delivery_address: DeliveryAddress,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        now: Optional[datetime] = None
     ) -> Order:
         """Create a new order"""
         # Validate items availability
         if not items:
             raise OrderCreationException("Cannot create an order without items")
         
-        availability = await self.inventory_service.validate_items_availability(items)
+        _, unavailable = await self.inventory_service.validate_items_availability(items)
         
         # Check if all items are available
-        unavailable_items = [str(item_id) for item_id, is_available in availability.items() if not is_available]
-        if unavailable_items:
+        if unavailable:
+            unavailable_items = [str(product_id) for product_id in unavailable]
             raise InventoryValidationException(
                 f"Some items are not available",
                 {"unavailable_items": unavailable_items}
@@ -60,36 +98,26 @@ class OrderService(OrderServicePort):
             customer_id=customer_id,
             items=items,
             delivery_address=delivery_address,
-            notes=notes
+            notes=notes,
+            now=now
         )
         
         # Save the order
         saved_order = await self.order_repository.save(order)
         
         # Publish order created event
-        items_data = [
-            {
-                "id": str(item.id),
-                "product_id": str(item.product_id),
-                "name": item.name,
-                "quantity": item.quantity,
-                "unit_price": item.unit_price,
-                "total_price": item.total_price
-            }
-            for item in saved_order.items
-        ]
-        
         order_created_event = OrderCreatedEvent.create(
-            order_id=str(saved_order.id),
-            customer_id=str(saved_order.customer_id),
-            items=items_data,
+            order_id=saved_order.id,
+            customer_id=saved_order.customer_id,
+            items=saved_order.items,
             total_amount=saved_order.total.total,
             status=saved_order.status.value
         )
         
         await self.event_publisher.publish_event(
             event_type=order_created_event.event_type,
-            payload=order_created_event.__dict__
+            payload=order_created_event.to_bytes(),
+            key=saved_order.id
         )
         
         return saved_order
@@ -97,19 +125,17 @@ class OrderService(OrderServicePort):
     async def add_item_to_order(self, order_id: UUID, item: OrderItem) -> Order:
         """Add an item to an order"""
         # Find the order
-        order = await self.order_repository.find_by_id(order_id)
-        if not order:
-            raise OrderNotFoundException(f"Order with ID {order_id} not found")
+        order = await self._load_order(order_id)
         
         # Check if order is in a valid state for modification
-        if order.status != OrderStatus.CREATED and order.status != OrderStatus.PENDING:
+        if order.status not in MUTABLE_STATUSES:
             raise InvalidOrderStateException(
                 f"Cannot add items to an order with status {order.status.value}"
             )
         
         # Validate item availability
-        availability = await self.inventory_service.validate_items_availability([item])
-        if not availability.get(item.product_id, False):
+        available, _ = await self.inventory_service.validate_items_availability([item])
+        if item.product_id not in available:
             raise InventoryValidationException(
                 f"Item {item.name} is not available",
                 {"unavailable_item": str(item.product_id)}
@@ -123,100 +149,96 @@ class OrderService(OrderServicePort):
         
         return updated_order
     
-    async def remove_item_from_order(self, order_id: UUID, item_id: UUID) -> Order:
-        """Remove an item from an order"""
+    async def add_items_to_order(self, order_id: UUID, items: List[OrderItem]) -> Order:
+        """Add several items to an order with a single availability check and update"""
+        if not items:
+            raise OrderCreationException("Cannot add an empty list of items to an order")
+        
         # Find the order
-        order = await self.order_repository.find_by_id(order_id)
-        if not order:
-            raise OrderNotFoundException(f"Order with ID {order_id} not found")
+        order = await self._load_order(order_id)
         
         # Check if order is in a valid state for modification
-        if order.status != OrderStatus.CREATED and order.status != OrderStatus.PENDING:
+        if order.status not in MUTABLE_STATUSES:
             raise InvalidOrderStateException(
-                f"Cannot remove items from an order with status {order.status.value}"
+                f"Cannot add items to an order with status {order.status.value}"
             )
         
-        # Remove the item
-        order.remove_item(item_id)
+        # Validate availability of all items in one call
+        available, _ = await self.inventory_service.validate_items_availability(items)
+        unavailable_items = [str(item.product_id) for item in items if item.product_id not in available]
+        if unavailable_items:
+            raise InventoryValidationException(
+                f"Some items are not available",
+                {"unavailable_items": unavailable_items}
+            )
+        
+        # Add the items
+        for item in items:
+            order.add_item(item)
         
         # Update the order
         updated_order = await self.order_repository.update(order)
         
         return updated_order
     
-    async def update_order_status(self, order_id: UUID, status: OrderStatus) -> Order:
-        """Update the status of an order"""
+    async def remove_item_from_order(self, order_id: UUID, item_id: UUID) -> Order:
+        """Remove an item from an order"""
         # Find the order
-        order = await self.order_repository.find_by_id(order_id)
-        if not order:
-            raise OrderNotFoundException(f"Order with ID {order_id} not found")
+        order = await self._load_order(order_id)
         
-        # Track previous status for the event
-        previous_status = order.status.value
+        # Check if order is in a valid state for modification
+        if order.status not in MUTABLE_STATUSES:
+            raise InvalidOrderStateException(
+                f"Cannot remove items from an order with status {order.status.value}"
+            )
         
-        # Update the status
-        order.update_status(status)
+        # Remove the item
+        order.remove_item(item_id)
         
         # Update the order
         updated_order = await self.order_repository.update(order)
         
-        # Publish status updated event
-        status_updated_event = OrderStatusUpdatedEvent.create(
-            order_id=str(updated_order.id),
-            customer_id=str(updated_order.customer_id),
-            previous_status=previous_status,
-            new_status=updated_order.status.value
-        )
-        
-        await self.event_publisher.publish_event(
-            event_type=status_updated_event.event_type,
-            payload=status_updated_event.__dict__
-        )
-        
         return updated_order
     
+    async def update_order_status(self, order_id: UUID, status: OrderStatus) -> Order:
+        """Update the status of an order"""
+        return await self._mutate_and_publish(
+            order_id,
+            lambda order: order.update_status(status),
+            lambda order, previous_status: OrderStatusUpdatedEvent.create(
+                order_id=order.id,
+                customer_id=order.customer_id,
+                previous_status=previous_status,
+                new_status=order.status.value
+            )
+        )
+    
     async def cancel_order(self, order_id: UUID) -> Order:
         """Cancel an order"""
-        # Find the order
-        order = await self.order_repository.find_by_id(order_id)
-        if not order:
-            raise OrderNotFoundException(f"Order with ID {order_id} not found")
-        
-        # Track previous status for the event
-        previous_status = order.status.value
-        
-        # Cancel the order
-        order.cancel()
-        
-        # Update the order
-        updated_order = await self.order_repository.update(order)
-        
-        # Publish cancelled event
-        cancelled_event = OrderCancelledEvent.create(
-            order_id=str(updated_order.id),
-            customer_id=str(updated_order.customer_id)
-        )
-        
-        await self.event_publisher.publish_event(
-            event_type=cancelled_event.event_type,
-            payload=cancelled_event.__dict__
+        return await self._mutate_and_publish(
+            order_id,
+            lambda order: order.cancel(),
+            lambda order, previous_status: OrderCancelledEvent.create(
+                order_id=order.id,
+                customer_id=order.customer_id
+            )
         )
-        
-        return updated_order
     
     async def confirm_order(self, order_id: UUID) -> Order:
         """Confirm an order"""
         # Find the order
-        order = await self.order_repository.find_by_id(order_id)
-        if not order:
-            raise OrderNotFoundException(f"Order with ID {order_id} not found")
+        order = await self._load_order(order_id)
+        
+        # Nothing to validate, persist or publish when the order is already confirmed
+        if order.status is OrderStatus.CONFIRMED:
+            return order
         
         # Validate items availability again
-        availability = await self.inventory_service.validate_items_availability(order.items)
+        _, unavailable = await self.inventory_service.validate_items_availability(order.items)
         
         # Check if all items are available
-        unavailable_items = [str(item_id) for item_id, is_available in availability.items() if not is_available]
-        if unavailable_items:
+        if unavailable:
+            unavailable_items = [str(product_id) for product_id in unavailable]
             raise InventoryValidationException(
                 f"Some items are not available",
                 {"unavailable_items": unavailable_items}
@@ -233,27 +255,22 @@ class OrderService(OrderServicePort):
         
         # Publish events
         status_updated_event = OrderStatusUpdatedEvent.create(
-            order_id=str(updated_order.id),
-            customer_id=str(updated_order.customer_id),
+            order_id=updated_order.id,
+            customer_id=updated_order.customer_id,
             previous_status=previous_status,
             new_status=updated_order.status.value
         )
         
         confirmed_event = OrderConfirmedEvent.create(
-            order_id=str(updated_order.id),
-            customer_id=str(updated_order.customer_id),
+            order_id=updated_order.id,
+            customer_id=updated_order.customer_id,
             total_amount=updated_order.total.total
         )
         
-        await self.event_publisher.publish_event(
-            event_type=status_updated_event.event_type,
-            payload=status_updated_event.__dict__
-        )
-        
-        await self.event_publisher.publish_event(
-            event_type=confirmed_event.event_type,
-            payload=confirmed_event.__dict__
-        )
+        await self.event_publisher.publish_events([
+            (status_updated_event.event_type, status_updated_event.to_bytes()),
+            (confirmed_event.event_type, confirmed_event.to_bytes())
+        ], key=updated_order.id)
         
         return updated_order
 
@@ -0,0 +1,12 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def round_half_up(amount: Decimal) -> int:
+    """Round an amount to the nearest integer, halves away from zero"""
+    return int(amount.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def to_cents(amount: float) -> int:
+    """Convert a money amount to whole cents, rounding half up"""
+    # str() gives the shortest repr of the float, so 0.615 is read as 0.615 and not 0.61499...
+    return round_half_up(Decimal(str(amount)) * 100)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from uuid import UUID, uuid4
+from uuid import UUID
 from typing import Optional
 from datetime import datetime
 
+from src.domain.entities._uuidgen import fast_uuid7
+
 
 @dataclass
 class Customer:
@@ -16,7 +18,7 @@ class Customer:
     @staticmethod
     def create(name: str, email: str, phone: str) -> "Customer":
         return Customer(
-            id=uuid4(),
+            id=fast_uuid7(),
             name=name,
             email=email,
             phone=phone,
@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
-from typing import List, Optional
+from uuid import UUID
+from typing import Dict, List, Optional
 from datetime import datetime
 from enum import Enum
+from decimal import Decimal
 
+from src.domain.entities._money import round_half_up
+from src.domain.entities._uuidgen import fast_uuid7
 from src.domain.entities.order_item import OrderItem
 from src.domain.entities.customer import Customer
 from src.domain.value_objects.delivery_address import DeliveryAddress
@@ -20,7 +23,25 @@ class OrderStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass
+# Statuses in which the items of an order can still be changed
+MUTABLE_STATUSES: frozenset[OrderStatus] = frozenset({OrderStatus.CREATED, OrderStatus.PENDING})
+
+# Example tax rate: 10%
+_TAX_RATE_PERCENT = 10
+
+
+def _total_from_cents(subtotal_cents: int) -> OrderTotal:
+    """Build an order total applying the tax rate to a subtotal in cents"""
+    # Round the tax half up to the nearest cent
+    tax_cents = round_half_up(Decimal(subtotal_cents * _TAX_RATE_PERCENT) / 100)
+    return OrderTotal(
+        subtotal=subtotal_cents / 100,
+        tax=tax_cents / 100,
+        total=(subtotal_cents + tax_cents) / 100
+    )
+
+
+@dataclass(slots=True)
 class Order:
     id: UUID
     customer_id: UUID
@@ -31,71 +52,89 @@ class Order:
     notes: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: Optional[datetime] = None
+    # Index of the items by id, kept in step with items by add_item and remove_item
+    _items_by_id: Dict[UUID, OrderItem] = field(init=False, repr=False, compare=False)
+    # The list object _items_by_id was built from, to notice when items is replaced
+    _indexed_items: List[OrderItem] = field(init=False, repr=False, compare=False)
+    # Exact running subtotal, kept in step with items so totals never go back through floats
+    _subtotal_cents: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._reindex_items()
 
     @staticmethod
     def create(customer_id: UUID, items: List[OrderItem] = None, 
               delivery_address: Optional[DeliveryAddress] = None,
-              notes: Optional[str] = None) -> "Order":
+              notes: Optional[str] = None,
+              now: Optional[datetime] = None) -> "Order":
         items = items or []
         
-        # Calculate subtotal
-        subtotal = sum(item.total_price for item in items)
-        
-        # Apply taxes (example: 10%)
-        tax = subtotal * 0.10
-        
-        # Calculate total
-        total = OrderTotal(
-            subtotal=subtotal,
-            tax=tax,
-            total=subtotal + tax
-        )
+        # Calculate subtotal and apply taxes
+        total = _total_from_cents(sum([item.total_price_cents for item in items]))
         
         return Order(
-            id=uuid4(),
+            id=fast_uuid7(),
             customer_id=customer_id,
             items=items,
             delivery_address=delivery_address,
             total=total,
-            notes=notes
+            notes=notes,
+            created_at=now or datetime.now()
         )
     
     def add_item(self, item: OrderItem) -> None:
         """Add an item to the order and recalculate totals"""
-        if self.status != OrderStatus.CREATED and self.status != OrderStatus.PENDING:
+        if self.status not in MUTABLE_STATUSES:
             raise ValueError("Cannot add items to an order that is not in CREATED or PENDING status")
         
+        items_by_id = self._index_items()
         self.items.append(item)
-        self._recalculate_total()
+        items_by_id[item.id] = item
+        self._set_subtotal_cents(self._subtotal_cents + item.total_price_cents)
     
     def remove_item(self, item_id: UUID) -> None:
         """Remove an item from the order and recalculate totals"""
-        if self.status != OrderStatus.CREATED and self.status != OrderStatus.PENDING:
+        if self.status not in MUTABLE_STATUSES:
             raise ValueError("Cannot remove items from an order that is not in CREATED or PENDING status")
         
-        self.items = [item for item in self.items if item.id != item_id]
-        self._recalculate_total()
+        item = self._index_items().pop(item_id, None)
+        if item is None:
+            return
+        
+        self.items.remove(item)
+        self._set_subtotal_cents(self._subtotal_cents - item.total_price_cents)
     
-    def update_status(self, status: OrderStatus) -> None:
+    def update_status(self, status: OrderStatus, now: Optional[datetime] = None) -> None:
         """Update the order status"""
+        if status is self.status:
+            return
+        
         self.status = status
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
     
-    def cancel(self) -> None:
+    def cancel(self, now: Optional[datetime] = None) -> None:
         """Cancel the order"""
         if self.status == OrderStatus.DELIVERED:
             raise ValueError("Cannot cancel an order that has already been delivered")
+        if self.status is OrderStatus.CANCELLED:
+            return
         
         self.status = OrderStatus.CANCELLED
-        self.updated_at = datetime.now()
+        self.updated_at = now or datetime.now()
     
-    def _recalculate_total(self) -> None:
-        """Recalculate the order total"""
-        subtotal = sum(item.total_price for item in self.items)
-        tax = subtotal * 0.10  # Example tax rate: 10%
-        
-        self.total = OrderTotal(
-            subtotal=subtotal,
-            tax=tax,
-            total=subtotal + tax
-        )
\ No newline at end of file
+    def _index_items(self) -> Dict[UUID, OrderItem]:
+        """Return the items index, rebuilding it if the items list was replaced or resized directly"""
+        if self.items is not self._indexed_items or len(self._items_by_id) != len(self.items):
+            self._reindex_items()
+        return self._items_by_id
+    
+    def _reindex_items(self) -> None:
+        """Rebuild the items index and the running subtotal from the items list"""
+        self._indexed_items = self.items
+        self._items_by_id = {item.id: item for item in self.items}
+        self._subtotal_cents = sum(item.total_price_cents for item in self.items)
+    
+    def _set_subtotal_cents(self, subtotal_cents: int) -> None:
+        """Set the order total from an already known subtotal in cents"""
+        self._subtotal_cents = subtotal_cents
+        self.total = _total_from_cents(subtotal_cents)
\ No newline at end of file
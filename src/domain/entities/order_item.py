@@ -1,10 +1,13 @@
-from dataclasses import dataclass
-from uuid import UUID, uuid4
+from dataclasses import dataclass, field
+from uuid import UUID
 from typing import Optional
 from datetime import datetime
 
+from src.domain.entities._money import to_cents
+from src.domain.entities._uuidgen import fast_uuid7
 
-@dataclass
+
+@dataclass(eq=False, slots=True)
 class OrderItem:
     id: UUID
     product_id: UUID
@@ -13,17 +16,33 @@ class OrderItem:
     unit_price: float
     total_price: float
     notes: Optional[str] = None
-    created_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
+    # Exact integer amount used for order total arithmetic
+    total_price_cents: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.total_price_cents = to_cents(self.total_price)
+
+    # Items are identified by their id, so equality and hashing only look at it
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderItem):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return self.id.int
 
     @staticmethod
-    def create(product_id: UUID, name: str, quantity: int, unit_price: float, notes: Optional[str] = None) -> "OrderItem":
-        total_price = quantity * unit_price
+    def create(product_id: UUID, name: str, quantity: int, unit_price: float, notes: Optional[str] = None,
+               now: Optional[datetime] = None) -> "OrderItem":
+        total_price = quantity * to_cents(unit_price) / 100
         return OrderItem(
-            id=uuid4(),
+            id=fast_uuid7(),
             product_id=product_id,
             name=name,
             quantity=quantity,
             unit_price=unit_price,
             total_price=total_price,
-            notes=notes
+            notes=notes,
+            created_at=now or datetime.now()
         )
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -15,21 +15,33 @@ class OrderQueryPort(ABC):
         pass
     
     @abstractmethod
-    async def get_orders_by_customer_id(self, customer_id: UUID) -> List[Order]:
-        """Get all orders from a customer"""
+    def get_orders_by_customer_id(
+        self,
+        customer_id: UUID,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream a page of orders from a customer, newest first"""
         pass
     
     @abstractmethod
-    async def get_orders_by_status(self, status: OrderStatus) -> List[Order]:
-        """Get all orders with a specific status"""
+    def get_orders_by_status(
+        self,
+        status: OrderStatus,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream a page of orders with a specific status, newest first"""
         pass
     
     @abstractmethod
-    async def get_orders_by_date_range(
+    def get_orders_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
-        status: Optional[OrderStatus] = None
-    ) -> List[Order]:
-        """Get all orders within a date range, optionally filtered by status"""
+        status: Optional[OrderStatus] = None,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Stream a page of orders within a date range, oldest first, optionally filtered by status"""
         pass
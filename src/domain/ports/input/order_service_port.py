@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
+from datetime import datetime
 
 from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
@@ -16,7 +17,8 @@ class OrderServicePort(ABC):
         customer_id: UUID,
         items: List[OrderItem],
         delivery_address: DeliveryAddress,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        now: Optional[datetime] = None
     ) -> Order:
         """Create a new order"""
         pass
@@ -26,6 +28,11 @@ class OrderServicePort(ABC):
         """Add an item to an order"""
         pass
     
+    @abstractmethod
+    async def add_items_to_order(self, order_id: UUID, items: List[OrderItem]) -> Order:
+        """Add several items to an order in a single operation"""
+        pass
+    
     @abstractmethod
     async def remove_item_from_order(self, order_id: UUID, item_id: UUID) -> Order:
         """Remove an item from an order"""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import List, Optional, Tuple
+from uuid import UUID
 
 from src.domain.entities.order import Order
 
@@ -28,6 +29,15 @@ class EventPublisherPort(ABC):
         pass
     
     @abstractmethod
-    async def publish_event(self, event_type: str, payload: Dict[str, Any], topic: Optional[str] = None) -> None:
-        """Publish a generic event"""
+    async def publish_event(
+        self, event_type: str, payload: bytes, topic: Optional[str] = None, key: Optional[UUID] = None
+    ) -> None:
+        """Publish a generic event, keyed so events of one order stay in one partition"""
+        pass
+    
+    @abstractmethod
+    async def publish_events(
+        self, events: List[Tuple[str, bytes]], topic: Optional[str] = None, key: Optional[UUID] = None
+    ) -> None:
+        """Publish several (event_type, payload) events under one key as a single ordered batch"""
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import List, Tuple
 from uuid import UUID
 
 from src.domain.entities.order_item import OrderItem
@@ -9,10 +9,12 @@ class InventoryServicePort(ABC):
     """Port for inventory service operations"""
     
     @abstractmethod
-    async def validate_items_availability(self, items: List[OrderItem]) -> Dict[UUID, bool]:
+    async def validate_items_availability(
+        self, items: List[OrderItem]
+    ) -> Tuple[frozenset[UUID], frozenset[UUID]]:
         """
         Validate the availability of items
         
-        Returns a dictionary with item IDs as keys and boolean availability as values
+        Returns the product IDs that are available and the ones that are not
         """
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -20,23 +20,47 @@ class OrderRepositoryPort(ABC):
         pass
     
     @abstractmethod
-    async def find_by_customer_id(self, customer_id: UUID) -> List[Order]:
-        """Find all orders for a customer"""
+    def find_by_customer_id(
+        self,
+        customer_id: UUID,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """
+        Stream a page of orders for a customer, newest first
+        
+        The cursor is the (created_at, id) of the last order of the previous page
+        """
         pass
     
     @abstractmethod
-    async def find_by_status(self, status: OrderStatus) -> List[Order]:
-        """Find all orders with a specific status"""
+    def find_by_status(
+        self,
+        status: OrderStatus,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """
+        Stream a page of orders with a specific status, newest first
+        
+        The cursor is the (created_at, id) of the last order of the previous page
+        """
         pass
     
     @abstractmethod
-    async def find_by_date_range(
+    def find_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
-        status: Optional[OrderStatus] = None
-    ) -> List[Order]:
-        """Find all orders within a date range, optionally filtered by status"""
+        status: Optional[OrderStatus] = None,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """
+        Stream a page of orders within a date range, oldest first, optionally filtered by status
+        
+        The cursor is the (created_at, id) of the last order of the previous page
+        """
         pass
     
     @abstractmethod
@@ -1,8 +1,11 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
 
-@dataclass(frozen=True)
+_FIELDS = ("street", "city", "state", "postal_code", "country", "apartment", "instructions")
+
+
+@dataclass(frozen=True, slots=True)
 class DeliveryAddress:
     street: str
     city: str
@@ -11,9 +14,19 @@ class DeliveryAddress:
     country: str
     apartment: Optional[str] = None
     instructions: Optional[str] = None
+    # Formatted once on creation since the address is immutable
+    _str: str = field(init=False, repr=False, compare=False, default="")
     
-    def __str__(self) -> str:
+    def __post_init__(self) -> None:
         base_address = f"{self.street}, {self.city}, {self.state} {self.postal_code}, {self.country}"
         if self.apartment:
             base_address = f"{base_address}, Apt/Suite: {self.apartment}"
-        return base_address
\ No newline at end of file
+        object.__setattr__(self, "_str", base_address)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeliveryAddress":
+        """Build an address from a plain dict, leaving missing optional fields empty"""
+        return cls(*map(data.get, _FIELDS))
+    
+    def __str__(self) -> str:
+        return self._str
\ No newline at end of file
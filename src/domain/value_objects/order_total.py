@@ -1,11 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderTotal:
     subtotal: float
     tax: float
     total: float
+    # Formatted once on creation since the total is immutable
+    _str: str = field(init=False, repr=False, compare=False, default="")
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_str", f"Total: ${self.total:.2f} (Subtotal: ${self.subtotal:.2f} + Tax: ${self.tax:.2f})"
+        )
     
     def __str__(self) -> str:
-        return f"Total: ${self.total:.2f} (Subtotal: ${self.subtotal:.2f} + Tax: ${self.tax:.2f})"
\ No newline at end of file
+        return self._str
\ No newline at end of file
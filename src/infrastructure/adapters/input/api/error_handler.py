@@ -1,5 +1,5 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
@@ -17,7 +17,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     async def domain_exception_handler(request: Request, exc: DomainException):
         """Handle domain exceptions"""
         logger.error(f"Domain exception: {exc.message}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"message": exc.message, "details": exc.details}
         )
@@ -26,7 +26,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         """Handle HTTP exceptions"""
         logger.error(f"HTTP exception: {exc.detail}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"message": str(exc.detail)}
         )
@@ -35,7 +35,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle request validation errors"""
         logger.error(f"Validation error: {exc.errors()}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "message": "Validation error",
@@ -47,7 +47,7 @@ def setup_error_handlers(app: FastAPI) -> None:
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle all other exceptions"""
         logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"message": "Internal server error"}
         )
\ No newline at end of file
@@ -1,11 +1,14 @@
-from typing import List, Dict, Any, Optional
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 from uuid import UUID
+from datetime import datetime
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.ports.input.order_service_port import OrderServicePort
 from src.domain.ports.input.order_query_port import OrderQueryPort
-from src.domain.entities.order import OrderStatus
+from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
 from src.domain.value_objects.delivery_address import DeliveryAddress
 from src.domain.exceptions.domain_exceptions import (
@@ -16,12 +19,71 @@ from src.domain.exceptions.domain_exceptions import (
 from src.application.services.order_service import OrderService
 from src.application.services.order_query_service import OrderQueryService
 from src.application.mappers.order_mapper import OrderMapper
+from src.infrastructure.adapters.input.api.schemas import (
+    OrderCreateSchema,
+    OrderItemCreateSchema,
+    OrderStatusUpdateSchema
+)
 from src.infrastructure.adapters.output.repositories.order_repository import OrderRepository
-from src.infrastructure.adapters.output.services.inventory_service import InventoryService
-from src.infrastructure.adapters.output.messaging.kafka_event_publisher import KafkaEventPublisher
+from src.infrastructure.adapters.output.services.inventory_service import get_inventory_service
+from src.infrastructure.adapters.output.cache.redis_order_cache import get_order_cache
+from src.infrastructure.adapters.output.messaging.event_outbox import get_event_outbox
 from src.infrastructure.db.session import get_db_session
 
 
+_STATUS_BY_VALUE = {order_status.value: order_status for order_status in OrderStatus}
+_T = TypeVar("_T")
+
+# Default size of a page of customer orders; only the first page of this size is cached
+DEFAULT_ORDERS_PAGE_SIZE = 50
+
+# Above this many orders the response is mapped in a worker thread to keep the event loop responsive
+_EXECUTOR_MAPPING_THRESHOLD = 64
+
+
+def _orders_to_primitive(orders: List[Order]) -> List[Dict[str, Any]]:
+    """Map a list of orders to response dictionaries"""
+    return [OrderMapper.to_primitive(order) for order in orders]
+
+
+async def _changed_order_response(order: Order) -> Dict[str, Any]:
+    """Drop the cached reads affected by a changed order and build its response"""
+    await get_order_cache().invalidate(order.id, order.customer_id)
+    return OrderMapper.to_primitive(order)
+
+
+def domain_exceptions_to_http(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+    """Translate domain exceptions raised by a controller handler into HTTP errors"""
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> _T:
+        try:
+            return await func(*args, **kwargs)
+        except HTTPException:
+            raise
+        except OrderNotFoundException as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"message": e.message}
+            )
+        except InventoryValidationException as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail={"message": e.message, "details": e.details}
+            )
+        except DomainException as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"message": e.message, "details": e.details}
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={"message": f"An error occurred: {str(e)}"}
+            )
+
+    return wrapper
+
+
 class OrderController:
     """Controller for order-related API endpoints"""
     
@@ -29,8 +91,8 @@ class OrderController:
     async def get_order_service(session: AsyncSession = Depends(get_db_session)) -> OrderServicePort:
         """Dependency for getting the order service"""
         order_repository = OrderRepository(session)
-        inventory_service = InventoryService()
-        event_publisher = KafkaEventPublisher()
+        inventory_service = get_inventory_service()
+        event_publisher = get_event_outbox()
         
         return OrderService(
             order_repository=order_repository,
@@ -46,274 +108,158 @@ class OrderController:
         return OrderQueryService(order_repository)
     
     @staticmethod
+    def get_now() -> datetime:
+        """Dependency for getting a single timestamp shared by the whole request"""
+        return datetime.now()
+    
+    @staticmethod
+    @domain_exceptions_to_http
     async def create_order(
-        order_data: Dict[str, Any],
-        order_service: OrderServicePort = Depends(get_order_service)
+        order_data: OrderCreateSchema,
+        order_service: OrderServicePort = Depends(get_order_service),
+        now: datetime = Depends(get_now)
     ) -> Dict[str, Any]:
         """Create a new order"""
-        try:
-            # Extract customer ID
-            customer_id = order_data.get("customer_id")
-            
-            # Extract and create delivery address
-            delivery_address_data = order_data.get("delivery_address")
-            delivery_address = None
-            if delivery_address_data:
-                delivery_address = DeliveryAddress(
-                    street=delivery_address_data.get("street"),
-                    city=delivery_address_data.get("city"),
-                    state=delivery_address_data.get("state"),
-                    postal_code=delivery_address_data.get("postal_code"),
-                    country=delivery_address_data.get("country"),
-                    apartment=delivery_address_data.get("apartment"),
-                    instructions=delivery_address_data.get("instructions")
-                )
-            
-            # Extract and create order items
-            items_data = order_data.get("items", [])
-            items = []
-            for item_data in items_data:
-                item = OrderItem.create(
-                    product_id=item_data.get("product_id"),
-                    name=item_data.get("name"),
-                    quantity=item_data.get("quantity"),
-                    unit_price=item_data.get("unit_price"),
-                    notes=item_data.get("notes")
-                )
-                items.append(item)
-            
-            # Create the order
-            order = await order_service.create_order(
-                customer_id=customer_id,
-                items=items,
-                delivery_address=delivery_address,
-                notes=order_data.get("notes")
-            )
-            
-            # Convert to DTO for response
-            return OrderMapper.to_dto(order).__dict__
-            
-        except InventoryValidationException as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={"message": e.message, "details": e.details}
-            )
-        except DomainException as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"message": e.message, "details": e.details}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
+        # Create delivery address
+        delivery_address = DeliveryAddress.from_dict(order_data.delivery_address.model_dump())
+        
+        # Create order items
+        items = [
+            OrderItem.create(
+                product_id=item_data.product_id,
+                name=item_data.name,
+                quantity=item_data.quantity,
+                unit_price=item_data.unit_price,
+                notes=item_data.notes,
+                now=now
             )
+            for item_data in order_data.items
+        ]
+        
+        # Create the order
+        order = await order_service.create_order(
+            customer_id=order_data.customer_id,
+            items=items,
+            delivery_address=delivery_address,
+            notes=order_data.notes,
+            now=now
+        )
+        
+        # Convert to DTO for response
+        return await _changed_order_response(order)
     
     @staticmethod
+    @domain_exceptions_to_http
     async def get_order(
         order_id: UUID,
         order_query_service: OrderQueryPort = Depends(get_order_query_service)
     ) -> Dict[str, Any]:
         """Get an order by ID"""
-        try:
-            order = await order_query_service.get_order_by_id(order_id)
-            return OrderMapper.to_dto(order).__dict__
-            
-        except OrderNotFoundException as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"message": e.message}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
+        order_cache = get_order_cache()
+        cached = await order_cache.get_order(order_id)
+        if cached is not None:
+            return cached
+        
+        order = await order_query_service.get_order_by_id(order_id)
+        response = OrderMapper.to_primitive(order)
+        await order_cache.set_order(order_id, response)
+        return response
     
     @staticmethod
+    @domain_exceptions_to_http
     async def get_customer_orders(
         customer_id: UUID,
-        order_query_service: OrderQueryPort = Depends(get_order_query_service)
+        order_query_service: OrderQueryPort = Depends(get_order_query_service),
+        limit: int = DEFAULT_ORDERS_PAGE_SIZE,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Dict[str, Any]]:
-        """Get all orders for a customer"""
-        try:
-            orders = await order_query_service.get_orders_by_customer_id(customer_id)
-            return [OrderMapper.to_dto(order).__dict__ for order in orders]
-            
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
+        """Get a page of orders for a customer, newest first"""
+        order_cache = get_order_cache()
+        cacheable = cursor is None and limit == DEFAULT_ORDERS_PAGE_SIZE
+        if cacheable:
+            cached = await order_cache.get_customer_orders(customer_id)
+            if cached is not None:
+                return cached
+        
+        orders = [
+            order async for order in order_query_service.get_orders_by_customer_id(customer_id, limit, cursor)
+        ]
+        if len(orders) > _EXECUTOR_MAPPING_THRESHOLD:
+            response = await asyncio.get_running_loop().run_in_executor(None, _orders_to_primitive, orders)
+        else:
+            response = _orders_to_primitive(orders)
+        
+        if cacheable:
+            await order_cache.set_customer_orders(customer_id, response)
+        return response
     
     @staticmethod
+    @domain_exceptions_to_http
     async def update_order_status(
         order_id: UUID,
-        status_data: Dict[str, str],
+        status_data: OrderStatusUpdateSchema,
         order_service: OrderServicePort = Depends(get_order_service)
     ) -> Dict[str, Any]:
         """Update the status of an order"""
-        try:
-            # Extract the new status
-            status_str = status_data.get("status")
-            if not status_str:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={"message": "Status is required"}
-                )
-            
-            try:
-                order_status = OrderStatus(status_str)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={"message": f"Invalid status: {status_str}"}
-                )
-            
-            # Update the order status
-            order = await order_service.update_order_status(order_id, order_status)
-            
-            return OrderMapper.to_dto(order).__dict__
-            
-        except OrderNotFoundException as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"message": e.message}
-            )
-        except DomainException as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"message": e.message, "details": e.details}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
+        # The schema has already validated the status value
+        order_status = _STATUS_BY_VALUE[status_data.status.value]
+        
+        # Update the order status
+        order = await order_service.update_order_status(order_id, order_status)
+        
+        return await _changed_order_response(order)
     
     @staticmethod
+    @domain_exceptions_to_http
     async def confirm_order(
         order_id: UUID,
         order_service: OrderServicePort = Depends(get_order_service)
     ) -> Dict[str, Any]:
         """Confirm an order"""
-        try:
-            order = await order_service.confirm_order(order_id)
-            return OrderMapper.to_dto(order).__dict__
-            
-        except OrderNotFoundException as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"message": e.message}
-            )
-        except InventoryValidationException as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={"message": e.message, "details": e.details}
-            )
-        except DomainException as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"message": e.message, "details": e.details}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
+        order = await order_service.confirm_order(order_id)
+        return await _changed_order_response(order)
     
     @staticmethod
+    @domain_exceptions_to_http
     async def cancel_order(
         order_id: UUID,
         order_service: OrderServicePort = Depends(get_order_service)
     ) -> Dict[str, Any]:
         """Cancel an order"""
-        try:
-            order = await order_service.cancel_order(order_id)
-            return OrderMapper.to_dto(order).__dict__
-            
-        except OrderNotFoundException as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"message": e.message}
-            )
-        except DomainException as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"message": e.message, "details": e.details}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
+        order = await order_service.cancel_order(order_id)
+        return await _changed_order_response(order)
     
     @staticmethod
+    @domain_exceptions_to_http
     async def add_order_item(
         order_id: UUID,
-        item_data: Dict[str, Any],
-        order_service: OrderServicePort = Depends(get_order_service)
+        item_data: OrderItemCreateSchema,
+        order_service: OrderServicePort = Depends(get_order_service),
+        now: datetime = Depends(get_now)
     ) -> Dict[str, Any]:
         """Add an item to an order"""
-        try:
-            # Create the order item
-            item = OrderItem.create(
-                product_id=UUID(item_data.get("product_id")),
-                name=item_data.get("name"),
-                quantity=item_data.get("quantity"),
-                unit_price=item_data.get("unit_price"),
-                notes=item_data.get("notes")
-            )
-            
-            # Add the item to the order
-            order = await order_service.add_item_to_order(order_id, item)
-            
-            return OrderMapper.to_dto(order).__dict__
-            
-        except OrderNotFoundException as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"message": e.message}
-            )
-        except InventoryValidationException as e:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={"message": e.message, "details": e.details}
-            )
-        except DomainException as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"message": e.message, "details": e.details}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
+        # Create the order item
+        item = OrderItem.create(
+            product_id=item_data.product_id,
+            name=item_data.name,
+            quantity=item_data.quantity,
+            unit_price=item_data.unit_price,
+            notes=item_data.notes,
+            now=now
+        )
+        
+        # Add the item to the order
+        order = await order_service.add_item_to_order(order_id, item)
+        
+        return await _changed_order_response(order)
     
     @staticmethod
+    @domain_exceptions_to_http
     async def remove_order_item(
         order_id: UUID,
         item_id: UUID,
         order_service: OrderServicePort = Depends(get_order_service)
     ) -> Dict[str, Any]:
         """Remove an item from an order"""
-        try:
-            order = await order_service.remove_item_from_order(order_id, item_id)
-            return OrderMapper.to_dto(order).__dict__
-            
-        except OrderNotFoundException as e:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"message": e.message}
-            )
-        except DomainException as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"message": e.message, "details": e.details}
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"message": f"An error occurred: {str(e)}"}
-            )
\ No newline at end of file
+        order = await order_service.remove_item_from_order(order_id, item_id)
+        return await _changed_order_response(order)
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Body, Path, Query, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, Body, HTTPException, Path, Query, status
+from fastapi.responses import ORJSONResponse
 
 from src.domain.ports.input.order_service_port import OrderServicePort
-from src.infrastructure.adapters.input.api.order_controller import OrderController
+from src.infrastructure.adapters.input.api.order_controller import DEFAULT_ORDERS_PAGE_SIZE, OrderController
 from src.infrastructure.adapters.input.api.schemas import (
     OrderSchema, 
     OrderListResponse, 
@@ -35,6 +37,7 @@ router = APIRouter(
 async def create_order(
     order_data: OrderCreateSchema = Body(...),
     order_service: OrderServicePort = Depends(OrderController.get_order_service),
+    now: datetime = Depends(OrderController.get_now),
 ):
     """
     Create a new order.
@@ -44,7 +47,7 @@ async def create_order(
     - **delivery_address**: Delivery address details
     - **notes**: Optional notes for the order
     """
-    return await OrderController.create_order(order_data.dict(), order_service)
+    return await OrderController.create_order(order_data, order_service, now)
 
 
 @router.get(
@@ -64,7 +67,10 @@ async def get_order(
     
     - **order_id**: UUID of the order to retrieve
     """
-    return await OrderController.get_order(order_id, order_service)
+    order = await OrderController.get_order(order_id, order_service)
+    
+    # Reads are served from trusted controller output, so skip re-validating against response_model
+    return ORJSONResponse(content=order)
 
 
 @router.get(
@@ -76,14 +82,30 @@ async def get_order(
 )
 async def get_customer_orders(
     customer_id: UUID = Query(..., description="Customer ID to filter orders"),
+    limit: int = Query(DEFAULT_ORDERS_PAGE_SIZE, ge=1, le=200, description="Maximum number of orders to return"),
+    cursor_created_at: Optional[datetime] = Query(None, description="created_at of the last order of the previous page"),
+    cursor_id: Optional[UUID] = Query(None, description="ID of the last order of the previous page"),
     order_service: OrderServicePort = Depends(OrderController.get_order_query_service)
 ):
     """
-    Get all orders for a customer.
+    Get a page of orders for a customer, newest first.
     
     - **customer_id**: UUID of the customer
-    """
-    return await OrderController.get_customer_orders(customer_id, order_service)
+    - **limit**: Maximum number of orders to return
+    - **cursor_created_at** / **cursor_id**: Position of the last order of the previous page
+    """
+    if (cursor_created_at is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": "cursor_created_at and cursor_id must be given together"}
+        )
+    
+    cursor = (cursor_created_at, cursor_id) if cursor_id is not None else None
+    orders = await OrderController.get_customer_orders(customer_id, order_service, limit, cursor)
+    
+    # Returning the response directly skips re-validating every order against response_model,
+    # which is still used to document the endpoint
+    return ORJSONResponse(content=orders)
 
 
 @router.patch(
@@ -106,7 +128,7 @@ async def update_order_status(
     - **order_id**: UUID of the order to update
     - **status**: New status for the order (CREATED, PENDING, CONFIRMED, PREPARING, READY, DELIVERED, CANCELLED)
     """
-    return await OrderController.update_order_status(order_id, status_data.dict(), order_service)
+    return await OrderController.update_order_status(order_id, status_data, order_service)
 
 
 @router.post(
@@ -165,7 +187,8 @@ async def cancel_order(
 async def add_order_item(
     order_id: UUID = Path(..., description="The ID of the order"),
     item_data: OrderItemCreateSchema = Body(...),
-    order_service: OrderServicePort = Depends(OrderController.get_order_service)
+    order_service: OrderServicePort = Depends(OrderController.get_order_service),
+    now: datetime = Depends(OrderController.get_now)
 ):
     """
     Add an item to an order.
@@ -173,7 +196,7 @@ async def add_order_item(
     - **order_id**: UUID of the order
     - **item_data**: Item details (product_id, name, quantity, unit_price, notes)
     """
-    return await OrderController.add_order_item(order_id, item_data.dict(), order_service)
+    return await OrderController.add_order_item(order_id, item_data, order_service, now)
 
 
 @router.delete(
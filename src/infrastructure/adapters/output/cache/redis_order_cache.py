@@ -0,0 +1,96 @@
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.infrastructure.config.settings import Settings, get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisOrderCache:
+    """Cache-aside store for serialized order responses
+
+    Caching is disabled when REDIS_URL is not configured, and Redis errors are
+    logged and treated as cache misses so reads always fall back to the database.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        self.ttl = self.settings.ORDER_CACHE_TTL
+        self.client = None
+
+    async def start(self):
+        """Connect to Redis if a URL is configured"""
+        if self.client is None and self.settings.REDIS_URL:
+            self.client = Redis.from_url(self.settings.REDIS_URL)
+            logger.info("Redis order cache started")
+
+    async def stop(self):
+        """Close the Redis connection pool"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            logger.info("Redis order cache stopped")
+
+    async def get_order(self, order_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get a cached order response"""
+        return await self._get(self._order_key(order_id))
+
+    async def set_order(self, order_id: UUID, order: Dict[str, Any]) -> None:
+        """Cache an order response"""
+        await self._set(self._order_key(order_id), order)
+
+    async def get_customer_orders(self, customer_id: UUID) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached order list of a customer"""
+        return await self._get(self._customer_orders_key(customer_id))
+
+    async def set_customer_orders(self, customer_id: UUID, orders: List[Dict[str, Any]]) -> None:
+        """Cache the order list of a customer"""
+        await self._set(self._customer_orders_key(customer_id), orders)
+
+    async def invalidate(self, order_id: UUID, customer_id: UUID) -> None:
+        """Drop the cached entries affected by a change to an order"""
+        if self.client is None:
+            return
+        try:
+            await self.client.delete(self._order_key(order_id), self._customer_orders_key(customer_id))
+        except RedisError as e:
+            logger.warning(f"Error invalidating cached order {order_id}: {str(e)}")
+
+    async def _get(self, key: str) -> Optional[Any]:
+        if self.client is None:
+            return None
+        try:
+            raw = await self.client.get(key)
+        except RedisError as e:
+            logger.warning(f"Error reading {key} from cache: {str(e)}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def _set(self, key: str, value: Any) -> None:
+        if self.client is None:
+            return
+        try:
+            await self.client.set(key, orjson.dumps(value), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Error writing {key} to cache: {str(e)}")
+
+    @staticmethod
+    def _order_key(order_id: UUID) -> str:
+        return f"order:{order_id}"
+
+    @staticmethod
+    def _customer_orders_key(customer_id: UUID) -> str:
+        return f"customer:{customer_id}:orders"
+
+
+@lru_cache()
+def get_order_cache() -> RedisOrderCache:
+    """Get the order cache shared by all requests"""
+    return RedisOrderCache()
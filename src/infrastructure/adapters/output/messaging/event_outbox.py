@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Deque, List, Optional, Tuple, Union
+from uuid import UUID
+
+from src.infrastructure.adapters.output.messaging.kafka_event_publisher import KafkaEventPublisher
+from src.infrastructure.config.settings import Settings
+
+
+logger = logging.getLogger(__name__)
+
+# (event_type, payload, topic, key, delivery) waiting to be sent; delivery is only set
+# when the publisher waits for the broker acknowledgement
+_OutboxEntry = Tuple[
+    str, bytes, str, Optional[Union[str, UUID]], Optional[asyncio.Future]
+]
+
+
+def _settle(delivery: Optional[asyncio.Future], error: Optional[BaseException] = None) -> None:
+    """Report the outcome of a sent event to a publisher waiting for it"""
+    if delivery is None or delivery.done():
+        return
+    if error is None:
+        delivery.set_result(None)
+    else:
+        delivery.set_exception(error)
+
+
+def _failed_send(error: BaseException) -> asyncio.Future:
+    """Stand in for the delivery future of a message the producer refused"""
+    future = asyncio.get_running_loop().create_future()
+    future.set_exception(error)
+    return future
+
+
+class EventOutbox(KafkaEventPublisher):
+    """
+    Kafka event publisher that returns as soon as an event is queued
+    
+    A background worker drains the in-process queue and sends the events in batches,
+    in the order they were queued. Events published with wait_for_ack go through the same
+    queue, so they never overtake earlier events, and their publisher waits for the broker.
+    Failed sends are retried with backoff. Events that still fail are set aside in the
+    bounded failed_events and queued again once the broker accepts a batch. They are kept
+    in memory only, so the ones still waiting are lost when the process stops.
+    
+    The producer is connected by the worker, never on the request path, so publishing
+    does not block on the broker while it is unreachable.
+    """
+    
+    def __init__(self, settings: Optional[Settings] = None):
+        super().__init__(settings)
+        self.batch_size = self.settings.KAFKA_OUTBOX_BATCH_SIZE
+        self.max_retries = self.settings.KAFKA_OUTBOX_MAX_RETRIES
+        self.retry_backoff = self.settings.KAFKA_OUTBOX_RETRY_BACKOFF_MS / 1000
+        # Events that could not be delivered after every retry, waiting to be queued again;
+        # the oldest is dropped when it is full
+        self.failed_events: Deque[_OutboxEntry] = deque(maxlen=self.settings.KAFKA_OUTBOX_MAX_FAILED)
+        self._queue: asyncio.Queue[_OutboxEntry] = asyncio.Queue(maxsize=self.settings.KAFKA_OUTBOX_MAX_SIZE)
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """Start the outbox worker and the Kafka producer"""
+        self._start_worker()
+        await super().start()
+    
+    def _start_worker(self) -> None:
+        """Start the worker draining the queue, if it is not running yet"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+    
+    async def stop(self):
+        """Send the queued events, then stop the outbox worker and the Kafka producer"""
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self.failed_events:
+            logger.error(f"Stopping with {len(self.failed_events)} undelivered events")
+        await super().stop()
+    
+    async def publish_event(self, event_type: str, payload: bytes,
+                           topic: Optional[str] = None, key: Optional[Union[str, UUID]] = None,
+                           wait_for_ack: bool = False) -> None:
+        """Queue an event for the worker, waiting for its delivery when wait_for_ack is set"""
+        self._start_worker()
+        
+        delivery = asyncio.get_running_loop().create_future() if wait_for_ack else None
+        # Only waits when the queue is full, pushing back on the callers
+        await self._queue.put((event_type, payload, topic or self.default_topic, key, delivery))
+        if delivery is not None:
+            await delivery
+    
+    async def publish_events(self, events: List[Tuple[str, bytes]],
+                            topic: Optional[str] = None, key: Optional[Union[str, UUID]] = None) -> None:
+        """Queue several events under one key; the single worker keeps their order"""
+        for event_type, payload in events:
+            await self.publish_event(event_type, payload, topic, key)
+    
+    async def _drain(self) -> None:
+        """Send queued events in batches of up to batch_size"""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                if await self._deliver(batch):
+                    self._requeue_failed()
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def _deliver(self, batch: List[_OutboxEntry]) -> bool:
+        """
+        Send a batch, retrying the failed events with exponential backoff
+        
+        The worker does not move on while it retries, so later events cannot overtake
+        the failed ones. Events still failing after the last retry are set aside in
+        failed_events. Returns whether the whole batch was delivered.
+        """
+        failures = await self._send_batch(batch)
+        for attempt in range(self.max_retries):
+            if not failures:
+                return True
+            await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+            failures = await self._send_batch([entry for entry, _ in failures])
+        if not failures:
+            return True
+        
+        for entry, error in failures:
+            logger.error(f"Giving up on event {entry[0]} after {self.max_retries} retries: {str(error)}")
+            if len(self.failed_events) == self.failed_events.maxlen:
+                logger.error(f"Dropping undelivered event {self.failed_events[0][0]}, too many failed events")
+            # The publisher learns about the failure now; a later re-send is not reported to it
+            event_type, payload, topic, key, delivery = entry
+            self.failed_events.append((event_type, payload, topic, key, None))
+            _settle(delivery, error)
+        return False
+    
+    def _requeue_failed(self) -> None:
+        """Queue set-aside events again, as far as the queue has room for them"""
+        while self.failed_events and not self._queue.full():
+            self._queue.put_nowait(self.failed_events.popleft())
+    
+    async def _send_batch(self, batch: List[_OutboxEntry]) -> List[Tuple[_OutboxEntry, BaseException]]:
+        """Hand a batch to the producer, wait for the broker acknowledgements and return the failures"""
+        if self.producer is None:
+            try:
+                await super().start()
+            except Exception as e:
+                logger.warning(f"Kafka producer is not available: {str(e)}")
+                return [(entry, e) for entry in batch]
+        
+        sends = []
+        for _, payload, topic, key, _ in batch:
+            try:
+                sends.append(await self.producer.send(topic=topic, value=payload, key=key))
+            except Exception as e:
+                sends.append(_failed_send(e))
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        
+        failures = []
+        for entry, result in zip(batch, results):
+            event_type, _, topic, _, delivery = entry
+            if isinstance(result, BaseException):
+                logger.warning(f"Error publishing event {event_type}: {str(result)}")
+                failures.append((entry, result))
+            else:
+                logger.info(f"Event {event_type} published to topic {topic}")
+                _settle(delivery)
+        return failures
+
+
+@lru_cache()
+def get_event_outbox() -> EventOutbox:
+    """Get the event outbox shared by all requests"""
+    return EventOutbox()
@@ -1,6 +1,7 @@
-import json
 import logging
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import List, Optional, Tuple, Union
+from uuid import UUID
 from aiokafka import AIOKafkaProducer
 import asyncio
 
@@ -12,29 +13,48 @@ from src.application.events.order_events import (
     OrderCancelledEvent,
     OrderStatusUpdatedEvent
 )
-from src.infrastructure.config.settings import get_settings
+from src.infrastructure.config.settings import Settings, get_settings
 
 
 logger = logging.getLogger(__name__)
 
 
+def _log_delivery(event_type: str, topic: str, future: asyncio.Future) -> None:
+    """Report the broker outcome of a message that was not awaited"""
+    if future.cancelled():
+        logger.error(f"Publishing of event {event_type} to topic {topic} was cancelled")
+    elif future.exception() is not None:
+        logger.error(f"Error publishing event {event_type}: {str(future.exception())}")
+    else:
+        logger.info(f"Event {event_type} published to topic {topic}")
+
+
 class KafkaEventPublisher(EventPublisherPort):
-    def __init__(self):
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
         self.producer = None
         self.default_topic = self.settings.KAFKA_ORDER_TOPIC
+        # Lets publishers wait for a start already in progress instead of starting a second producer
+        self._start_lock = asyncio.Lock()
     
     async def start(self):
         """Start the Kafka producer"""
-        if self.producer is None:
-            self.producer = AIOKafkaProducer(
+        async with self._start_lock:
+            if self.producer is not None:
+                return
+            
+            producer = AIOKafkaProducer(
                 bootstrap_servers=self.settings.KAFKA_BOOTSTRAP_SERVERS,
                 client_id=self.settings.KAFKA_CLIENT_ID,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
+                linger_ms=self.settings.KAFKA_LINGER_MS,
+                compression_type=self.settings.KAFKA_COMPRESSION_TYPE,
+                max_batch_size=self.settings.KAFKA_MAX_BATCH_SIZE,
                 key_serializer=lambda k: str(k).encode('utf-8') if k else None
             )
             
-            await self.producer.start()
+            # Only expose the producer once it is connected
+            await producer.start()
+            self.producer = producer
             logger.info("Kafka producer started")
     
     async def stop(self):
@@ -44,19 +64,18 @@ class KafkaEventPublisher(EventPublisherPort):
             self.producer = None
             logger.info("Kafka producer stopped")
     
+    async def flush(self):
+        """Wait until every pending message has been delivered"""
+        if self.producer is not None:
+            await self.producer.flush()
+    
     async def publish_order_created(self, order: Order) -> None:
         """Publish an order created event"""
         # Create event
         event = OrderCreatedEvent.create(
             order_id=order.id,
             customer_id=order.customer_id,
-            items=[{
-                "id": str(item.id),
-                "product_id": str(item.product_id),
-                "name": item.name,
-                "quantity": item.quantity,
-                "price": item.unit_price
-            } for item in order.items],
+            items=order.items,
             total_amount=order.total.total,
             status=order.status.value
         )
@@ -64,8 +83,8 @@ class KafkaEventPublisher(EventPublisherPort):
         # Publish event
         await self.publish_event(
             event_type=event.event_type,
-            payload=event.__dict__,
-            key=str(order.id)
+            payload=event.to_bytes(),
+            key=order.id
         )
     
     async def publish_order_confirmed(self, order: Order) -> None:
@@ -77,11 +96,12 @@ class KafkaEventPublisher(EventPublisherPort):
             total_amount=order.total.total
         )
         
-        # Publish event
+        # Publish event, waiting for the broker since confirmation must not be lost
         await self.publish_event(
             event_type=event.event_type,
-            payload=event.__dict__,
-            key=str(order.id)
+            payload=event.to_bytes(),
+            key=order.id,
+            wait_for_ack=True
         )
     
     async def publish_order_cancelled(self, order: Order) -> None:
@@ -95,8 +115,8 @@ class KafkaEventPublisher(EventPublisherPort):
         # Publish event
         await self.publish_event(
             event_type=event.event_type,
-            payload=event.__dict__,
-            key=str(order.id)
+            payload=event.to_bytes(),
+            key=order.id
         )
     
     async def publish_order_status_updated(self, order: Order, previous_status: str) -> None:
@@ -112,13 +132,19 @@ class KafkaEventPublisher(EventPublisherPort):
         # Publish event
         await self.publish_event(
             event_type=event.event_type,
-            payload=event.__dict__,
-            key=str(order.id)
+            payload=event.to_bytes(),
+            key=order.id
         )
     
-    async def publish_event(self, event_type: str, payload: Dict[str, Any], 
-                           topic: Optional[str] = None, key: Optional[str] = None) -> None:
-        """Publish a generic event to Kafka"""
+    async def publish_event(self, event_type: str, payload: bytes, 
+                           topic: Optional[str] = None, key: Optional[Union[str, UUID]] = None,
+                           wait_for_ack: bool = False) -> None:
+        """
+        Publish a generic event to Kafka
+        
+        The message is handed to the producer batch and its delivery is logged in the
+        background, unless wait_for_ack is set and the broker acknowledgement is awaited.
+        """
         if self.producer is None:
             await self.start()
         
@@ -126,17 +152,50 @@ class KafkaEventPublisher(EventPublisherPort):
             # Use the provided topic or default to the configured topic
             kafka_topic = topic or self.default_topic
             
-            # Publish the message
-            await self.producer.send_and_wait(
+            # Enqueue the message in the producer batch
+            future = await self.producer.send(
                 topic=kafka_topic,
                 value=payload,
                 key=key
             )
             
-            logger.info(f"Event {event_type} published to topic {kafka_topic}")
+            if wait_for_ack:
+                await future
+                logger.info(f"Event {event_type} published to topic {kafka_topic}")
+            else:
+                future.add_done_callback(partial(_log_delivery, event_type, kafka_topic))
             
         except Exception as e:
             logger.error(f"Error publishing event {event_type}: {str(e)}")
             # In a production system, we might want to implement a retry mechanism,
             # or store failed events for later reprocessing
+            raise
+    
+    async def publish_events(self, events: List[Tuple[str, bytes]], 
+                            topic: Optional[str] = None, key: Optional[Union[str, UUID]] = None) -> None:
+        """
+        Publish several events to Kafka in a single producer batch, preserving their order
+        
+        Every event is sent with the same key, so they land in one partition and are consumed
+        in the order they were sent.
+        """
+        if self.producer is None:
+            await self.start()
+        
+        event_types = ", ".join(event_type for event_type, _ in events)
+        
+        try:
+            kafka_topic = topic or self.default_topic
+            
+            # Enqueue every message before waiting so they share a batch
+            futures = [
+                await self.producer.send(topic=kafka_topic, value=payload, key=key)
+                for _, payload in events
+            ]
+            await asyncio.gather(*futures)
+            
+            logger.info(f"Events {event_types} published to topic {kafka_topic}")
+            
+        except Exception as e:
+            logger.error(f"Error publishing events {event_types}: {str(e)}")
             raise
\ No newline at end of file
@@ -1,9 +1,10 @@
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 import json
 
-from sqlalchemy import select
+from sqlalchemy import Select, delete, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,6 +17,60 @@ from src.domain.value_objects.order_total import OrderTotal
 from src.infrastructure.db.models.order_model import OrderModel, OrderItemModel, CustomerModel
 
 
+# Rows fetched per round-trip when streaming bulk queries
+_STREAM_BATCH_SIZE = 100
+
+# Plain order columns outer-joined with labelled item columns, one row per item
+_ORDER_ROWS_QUERY = (
+    select(
+        OrderModel.id,
+        OrderModel.customer_id,
+        OrderModel.status,
+        OrderModel.notes,
+        OrderModel.created_at,
+        OrderModel.updated_at,
+        OrderModel.delivery_address,
+        OrderModel.total,
+        OrderItemModel.id.label("item_id"),
+        OrderItemModel.product_id.label("item_product_id"),
+        OrderItemModel.name.label("item_name"),
+        OrderItemModel.quantity.label("item_quantity"),
+        OrderItemModel.unit_price.label("item_unit_price"),
+        OrderItemModel.total_price.label("item_total_price"),
+        OrderItemModel.notes.label("item_notes"),
+        OrderItemModel.created_at.label("item_created_at")
+    )
+    .select_from(OrderModel)
+    .outerjoin(OrderItemModel, OrderItemModel.order_id == OrderModel.id)
+)
+
+
+def _page_query(
+    *criteria: Any,
+    limit: int,
+    cursor: Optional[Tuple[datetime, UUID]],
+    newest_first: bool = True
+) -> Select:
+    """
+    Build the order/item rows query for one keyset page of the orders matching criteria
+    
+    The cursor is the (created_at, id) of the last order of the previous page.
+    """
+    if newest_first:
+        ordering = (OrderModel.created_at.desc(), OrderModel.id.desc())
+    else:
+        ordering = (OrderModel.created_at, OrderModel.id)
+    
+    # Page over order ids first so the limit counts orders, not joined item rows
+    page = select(OrderModel.id).where(*criteria).order_by(*ordering).limit(limit)
+    if cursor:
+        position = tuple_(OrderModel.created_at, OrderModel.id)
+        page = page.where(position < cursor if newest_first else position > cursor)
+    
+    page = page.subquery()
+    return _ORDER_ROWS_QUERY.join(page, page.c.id == OrderModel.id).order_by(*ordering)
+
+
 class OrderRepository(OrderRepositoryPort):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -34,12 +89,9 @@ class OrderRepository(OrderRepositoryPort):
             total=self._order_total_to_dict(order.total)
         )
         
-        # Add order model to session
-        self.session.add(order_model)
-        
         # Create order items
-        for item in order.items:
-            order_item_model = OrderItemModel(
+        item_models = [
+            OrderItemModel(
                 id=item.id,
                 order_id=order.id,
                 product_id=item.product_id,
@@ -50,11 +102,20 @@ class OrderRepository(OrderRepositoryPort):
                 notes=item.notes,
                 created_at=item.created_at
             )
-            self.session.add(order_item_model)
+            for item in order.items
+        ]
+        
+        # Add the order and its items to the session in one call; the items are
+        # flushed as a single multi-row INSERT
+        self.session.add(order_model)
+        self.session.add_all(item_models)
         
         # Commit changes
         await self.session.commit()
         
+        # The entity is returned, so the session need not keep the models alive
+        self.session.expunge_all()
+        
         # Return the saved order
         return order
     
@@ -72,122 +133,140 @@ class OrderRepository(OrderRepositoryPort):
         if not order_model:
             return None
         
-        return self._model_to_entity(order_model)
-    
-    async def find_by_customer_id(self, customer_id: UUID) -> List[Order]:
-        """Find all orders for a customer"""
-        query = (
-            select(OrderModel)
-            .options(selectinload(OrderModel.items))
-            .where(OrderModel.customer_id == customer_id)
-        )
-        
-        result = await self.session.execute(query)
-        order_models = result.scalars().all()
+        order = self._model_to_entity(order_model)
         
-        return [self._model_to_entity(model) for model in order_models]
+        # Detach the loaded model graph; only the entity outlives this call
+        self.session.expunge_all()
+        return order
     
-    async def find_by_status(self, status: OrderStatus) -> List[Order]:
-        """Find all orders with a specific status"""
-        query = (
-            select(OrderModel)
-            .options(selectinload(OrderModel.items))
-            .where(OrderModel.status == status.value)
-        )
+    async def find_by_customer_id(
+        self,
+        customer_id: UUID,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Find a page of orders for a customer, newest first, using keyset pagination"""
+        query = _page_query(OrderModel.customer_id == customer_id, limit=limit, cursor=cursor)
         
-        result = await self.session.execute(query)
-        order_models = result.scalars().all()
+        async for order in self._stream_orders(query):
+            yield order
+    
+    async def find_by_status(
+        self,
+        status: OrderStatus,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Find a page of orders with a specific status, newest first, using keyset pagination"""
+        query = _page_query(OrderModel.status == status.value, limit=limit, cursor=cursor)
         
-        return [self._model_to_entity(model) for model in order_models]
+        async for order in self._stream_orders(query):
+            yield order
     
     async def find_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
-        status: Optional[OrderStatus] = None
-    ) -> List[Order]:
-        """Find all orders within a date range, optionally filtered by status"""
-        query = (
-            select(OrderModel)
-            .options(selectinload(OrderModel.items))
-            .where(OrderModel.created_at >= start_date)
-            .where(OrderModel.created_at <= end_date)
-        )
-        
+        status: Optional[OrderStatus] = None,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> AsyncIterator[Order]:
+        """Find a page of orders within a date range, oldest first, optionally filtered by status"""
+        criteria = [OrderModel.created_at >= start_date, OrderModel.created_at <= end_date]
         if status:
-            query = query.where(OrderModel.status == status.value)
+            criteria.append(OrderModel.status == status.value)
+        query = _page_query(*criteria, limit=limit, cursor=cursor, newest_first=False)
         
-        result = await self.session.execute(query)
-        order_models = result.scalars().all()
+        async for order in self._stream_orders(query):
+            yield order
+    
+    async def _stream_orders(self, query: Select) -> AsyncIterator[Order]:
+        """
+        Stream orders from plain order/item join rows, bypassing ORM hydration
+        
+        The query must keep the rows of each order adjacent.
+        """
+        result = await self.session.stream(query.execution_options(yield_per=_STREAM_BATCH_SIZE))
+        
+        current_row = None
+        items: List[OrderItem] = []
+        async for row in result:
+            if current_row is not None and row.id != current_row.id:
+                yield self._order_to_entity(current_row, items)
+                items = []
+            
+            current_row = row
+            if row.item_id is not None:
+                items.append(OrderItem(
+                    id=row.item_id,
+                    product_id=row.item_product_id,
+                    name=row.item_name,
+                    quantity=row.item_quantity,
+                    unit_price=row.item_unit_price,
+                    total_price=row.item_total_price,
+                    notes=row.item_notes,
+                    created_at=row.item_created_at
+                ))
         
-        return [self._model_to_entity(model) for model in order_models]
+        if current_row is not None:
+            yield self._order_to_entity(current_row, items)
     
     async def update(self, order: Order) -> Order:
         """Update an existing order"""
-        # Fetch the existing order
-        query = (
-            select(OrderModel)
-            .options(selectinload(OrderModel.items))
+        # Update the order fields, using RETURNING to detect a missing order
+        result = await self.session.execute(
+            update(OrderModel)
             .where(OrderModel.id == order.id)
+            .values(
+                status=order.status.value,
+                notes=order.notes,
+                updated_at=order.updated_at if order.updated_at else datetime.now(),
+                delivery_address=self._delivery_address_to_dict(order.delivery_address) if order.delivery_address else None,
+                total=self._order_total_to_dict(order.total)
+            )
+            .returning(OrderModel.id)
+            .execution_options(synchronize_session=False)
         )
         
-        result = await self.session.execute(query)
-        order_model = result.scalars().first()
-        
-        if not order_model:
+        if result.scalars().first() is None:
             raise ValueError(f"Order with ID {order.id} not found")
         
-        # Update the order fields
-        order_model.status = order.status.value
-        order_model.notes = order.notes
-        order_model.updated_at = order.updated_at if order.updated_at else datetime.now()
-        order_model.delivery_address = self._delivery_address_to_dict(order.delivery_address) if order.delivery_address else None
-        order_model.total = self._order_total_to_dict(order.total)
-        
-        # Track existing item IDs
-        existing_item_ids = {item.id for item in order_model.items}
-        updated_item_ids = {item.id for item in order.items}
-        
-        # Items to add (in updated but not in existing)
-        items_to_add = [item for item in order.items if item.id not in existing_item_ids]
-        
-        # Items to remove (in existing but not in updated)
-        items_to_remove = [item for item in order_model.items if item.id not in updated_item_ids]
-        
-        # Items to update (in both)
-        items_to_update = [item for item in order.items if item.id in existing_item_ids]
-        
-        # Remove items
-        for item in items_to_remove:
-            await self.session.delete(item)
+        # Remove items that are no longer part of the order
+        await self.session.execute(
+            delete(OrderItemModel)
+            .where(OrderItemModel.order_id == order.id)
+            .where(OrderItemModel.id.not_in([item.id for item in order.items]))
+            .execution_options(synchronize_session=False)
+        )
         
-        # Add new items
-        for item in items_to_add:
-            order_item_model = OrderItemModel(
-                id=item.id,
-                order_id=order.id,
-                product_id=item.product_id,
-                name=item.name,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                total_price=item.total_price,
-                notes=item.notes,
-                created_at=item.created_at
+        # Insert new items and update existing ones in a single statement
+        if order.items:
+            upsert = insert(OrderItemModel).values([
+                {
+                    "id": item.id,
+                    "order_id": order.id,
+                    "product_id": item.product_id,
+                    "name": item.name,
+                    "quantity": item.quantity,
+                    "unit_price": item.unit_price,
+                    "total_price": item.total_price,
+                    "notes": item.notes,
+                    "created_at": item.created_at
+                }
+                for item in order.items
+            ])
+            await self.session.execute(
+                upsert.on_conflict_do_update(
+                    index_elements=[OrderItemModel.id],
+                    set_={
+                        "name": upsert.excluded.name,
+                        "quantity": upsert.excluded.quantity,
+                        "unit_price": upsert.excluded.unit_price,
+                        "total_price": upsert.excluded.total_price,
+                        "notes": upsert.excluded.notes
+                    }
+                )
             )
-            self.session.add(order_item_model)
-        
-        # Update existing items
-        for item in items_to_update:
-            query = select(OrderItemModel).where(OrderItemModel.id == item.id)
-            result = await self.session.execute(query)
-            item_model = result.scalars().first()
-            
-            if item_model:
-                item_model.name = item.name
-                item_model.quantity = item.quantity
-                item_model.unit_price = item.unit_price
-                item_model.total_price = item.total_price
-                item_model.notes = item.notes
         
         # Commit changes
         await self.session.commit()
@@ -222,37 +301,28 @@ class OrderRepository(OrderRepositoryPort):
             )
             items.append(item)
         
-        # Convert delivery address
+        return self._order_to_entity(order_model, items)
+    
+    def _order_to_entity(self, order_row: Any, items: List[OrderItem]) -> Order:
+        """Build an order entity from an order model or an order columns row"""
+        # Both JSON columns are always written with every field by the *_to_dict helpers
         delivery_address = None
-        if order_model.delivery_address:
-            delivery_address = DeliveryAddress(
-                street=order_model.delivery_address.get("street", ""),
-                city=order_model.delivery_address.get("city", ""),
-                state=order_model.delivery_address.get("state", ""),
-                postal_code=order_model.delivery_address.get("postal_code", ""),
-                country=order_model.delivery_address.get("country", ""),
-                apartment=order_model.delivery_address.get("apartment"),
-                instructions=order_model.delivery_address.get("instructions")
-            )
+        if order_row.delivery_address:
+            delivery_address = DeliveryAddress.from_dict(order_row.delivery_address)
         
-        # Convert total
-        total = OrderTotal(
-            subtotal=order_model.total.get("subtotal", 0),
-            tax=order_model.total.get("tax", 0),
-            total=order_model.total.get("total", 0)
-        )
+        total = OrderTotal(**order_row.total)
         
         # Create order entity
         return Order(
-            id=order_model.id,
-            customer_id=order_model.customer_id,
+            id=order_row.id,
+            customer_id=order_row.customer_id,
             items=items,
-            status=OrderStatus(order_model.status),
+            status=OrderStatus(order_row.status),
             delivery_address=delivery_address,
             total=total,
-            notes=order_model.notes,
-            created_at=order_model.created_at,
-            updated_at=order_model.updated_at
+            notes=order_row.notes,
+            created_at=order_row.created_at,
+            updated_at=order_row.updated_at
         )
     
     def _delivery_address_to_dict(self, address: DeliveryAddress) -> Dict[str, Any]:
@@ -1,26 +1,54 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from uuid import UUID
 import json
+import logging
 import httpx
-from httpx import AsyncClient, Timeout
+from httpx import AsyncClient, Limits, Timeout
 
 from src.domain.ports.output.inventory_service_port import InventoryServicePort
 from src.domain.entities.order_item import OrderItem
 from src.domain.exceptions.domain_exceptions import InventoryValidationException
-from src.infrastructure.config.settings import get_settings
+from src.infrastructure.config.settings import Settings, get_settings
+
+
+logger = logging.getLogger(__name__)
+
+# Relative to INVENTORY_SERVICE_URL, which is the base URL of the shared client
+_VALIDATE_PATH = "/api/v1/inventory/validate"
 
 
 class InventoryService(InventoryServicePort):
-    def __init__(self):
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
         self.base_url = self.settings.INVENTORY_SERVICE_URL
         self.timeout = Timeout(self.settings.INVENTORY_SERVICE_TIMEOUT)
+        self.client = None
+    
+    async def start(self):
+        """Open the pooled HTTP client shared by all requests"""
+        if self.client is None:
+            self.client = AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=Limits(max_connections=100, max_keepalive_connections=20)
+            )
+            logger.info("Inventory service client started")
     
-    async def validate_items_availability(self, items: List[OrderItem]) -> Dict[UUID, bool]:
+    async def stop(self):
+        """Close the pooled HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            logger.info("Inventory service client stopped")
+    
+    async def validate_items_availability(
+        self, items: List[OrderItem]
+    ) -> Tuple[frozenset[UUID], frozenset[UUID]]:
         """
         Validate the availability of items with the inventory service
         
-        Returns a dictionary with item IDs as keys and boolean availability as values
+        Returns the product IDs that are available and the ones that are not
         """
         # Prepare request data
         item_data = [
@@ -31,42 +59,52 @@ class InventoryService(InventoryServicePort):
             for item in items
         ]
         
+        if self.client is None:
+            await self.start()
+        
         try:
-            async with AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/inventory/validate",
-                    json={"items": item_data}
-                )
-                
-                if response.status_code != 200:
-                    error_msg = "Error validating inventory"
-                    try:
-                        error_data = response.json()
-                        if "message" in error_data:
-                            error_msg = error_data["message"]
-                    except json.JSONDecodeError:
-                        pass
-                    
-                    raise InventoryValidationException(
-                        error_msg,
-                        {"status_code": response.status_code}
-                    )
-                
-                # Process response
-                result_data = response.json()
-                availability = {}
-                
-                for item in items:
-                    product_id_str = str(item.product_id)
-                    # Default to False if not found in response
-                    is_available = result_data.get("availability", {}).get(product_id_str, False)
-                    availability[item.product_id] = is_available
-                
-                return availability
+            response = await self.client.post(
+                _VALIDATE_PATH,
+                json={"items": item_data}
+            )
+            
+            if response.status_code != 200:
+                error_msg = "Error validating inventory"
+                try:
+                    error_data = response.json()
+                    if "message" in error_data:
+                        error_msg = error_data["message"]
+                except json.JSONDecodeError:
+                    pass
                 
+                raise InventoryValidationException(
+                    error_msg,
+                    {"status_code": response.status_code}
+                )
+            
+            # Process response
+            availability = response.json().get("availability", {})
+            available = set()
+            unavailable = set()
+            
+            for item in items:
+                # Products missing from the response are treated as unavailable
+                if availability.get(str(item.product_id), False):
+                    available.add(item.product_id)
+                else:
+                    unavailable.add(item.product_id)
+            
+            return frozenset(available), frozenset(unavailable)
+            
         except httpx.RequestError as e:
             # Handle network errors, timeouts, etc.
             raise InventoryValidationException(
                 f"Error connecting to inventory service: {str(e)}",
                 {"error_type": type(e).__name__}
-            )
\ No newline at end of file
+            )
+
+
+@lru_cache()
+def get_inventory_service() -> InventoryService:
+    """Get the inventory service shared by all requests"""
+    return InventoryService()
\ No newline at end of file
@@ -1,47 +1,68 @@
 from functools import lru_cache
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
-from pydantic import PostgresDsn, field_validator
+from pydantic import PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+    
     # App settings
     APP_NAME: str = "Restaurant Order Service"
     APP_VERSION: str = "0.1.0"
     APP_DESCRIPTION: str = "API for managing restaurant orders"
     DEBUG: bool = False
+    TESTING: bool = False
+    # Worker processes; each one opens its own DB pool of up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+    WEB_CONCURRENCY: int = 1
     
     # Database settings
     ORDER_DATABASE_URL: str
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_USE_LIFO: bool = True
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Set both statement caches to 0 behind a transaction-pooling pgbouncer
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DB_JIT: bool = False  # JIT compilation only pays off on long analytical queries
+    DB_COMMAND_TIMEOUT: int = 30  # seconds
     
     # Kafka settings
     KAFKA_BOOTSTRAP_SERVERS: str
     KAFKA_ORDER_TOPIC: str = "restaurant.orders"
     KAFKA_CLIENT_ID: str = "order-service"
     KAFKA_GROUP_ID: str = "order-service-group"
+    KAFKA_LINGER_MS: int = 10
+    KAFKA_COMPRESSION_TYPE: Optional[str] = "lz4"
+    KAFKA_MAX_BATCH_SIZE: int = 131072  # bytes
+    KAFKA_OUTBOX_MAX_SIZE: int = 10000  # queued events
+    KAFKA_OUTBOX_BATCH_SIZE: int = 100  # events
+    KAFKA_OUTBOX_MAX_RETRIES: int = 5
+    KAFKA_OUTBOX_RETRY_BACKOFF_MS: int = 100  # doubled on every retry
+    KAFKA_OUTBOX_MAX_FAILED: int = 10000  # undelivered events kept for re-sending
     
     # Inventory service settings
     INVENTORY_SERVICE_URL: str
     INVENTORY_SERVICE_TIMEOUT: int = 5  # seconds
     
+    # Cache settings (caching is disabled when REDIS_URL is not set)
+    REDIS_URL: Optional[str] = None
+    ORDER_CACHE_TTL: int = 300  # seconds
+    
     # API settings
     API_PREFIX: str = "/api/v1"
     
-    # CORS settings
+    # CORS settings (comma separated)
     CORS_ORIGINS: str = "*"
     
-    @field_validator("CORS_ORIGINS")
-    def assemble_cors_origins(cls, v: str) -> list:
-        if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
-            return v
-        raise ValueError(v)
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @computed_field
+    @property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
 
 
 @lru_cache()
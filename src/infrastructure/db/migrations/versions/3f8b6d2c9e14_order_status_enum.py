@@ -0,0 +1,56 @@
+"""order status enum
+
+Revision ID: 3f8b6d2c9e14
+Revises: e93a1c7f4b28
+Create Date: 2026-10-15 13:00:00.000000
+
+Requires a maintenance window: changing the column type rewrites order_service.orders
+and rebuilds every index on it, including the ones 7c1e4a9b2d53 built CONCURRENTLY,
+all under an ACCESS EXCLUSIVE lock that blocks reads and writes of orders until the
+migration commits. Run it with the service stopped or drained.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b6d2c9e14'
+down_revision: Union[str, None] = 'e93a1c7f4b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+order_status = postgresql.ENUM(
+    'CREATED', 'PENDING', 'CONFIRMED', 'PREPARING', 'READY', 'DELIVERED', 'CANCELLED',
+    name='order_status',
+    schema='order_service'
+)
+
+
+def upgrade() -> None:
+    # 4 bytes per value instead of variable-length text, and only valid statuses are accepted
+    order_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        'orders',
+        'status',
+        type_=order_status,
+        existing_type=sa.String(50),
+        existing_nullable=False,
+        postgresql_using='status::order_service.order_status',
+        schema='order_service'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'orders',
+        'status',
+        type_=sa.String(50),
+        existing_type=order_status,
+        existing_nullable=False,
+        postgresql_using='status::text',
+        schema='order_service'
+    )
+    order_status.drop(op.get_bind(), checkfirst=True)
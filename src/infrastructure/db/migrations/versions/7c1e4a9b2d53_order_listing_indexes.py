@@ -0,0 +1,51 @@
+"""order listing indexes
+
+Revision ID: 7c1e4a9b2d53
+Revises: 280b728db17d
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4a9b2d53'
+down_revision: Union[str, None] = '280b728db17d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Match the ORDER BY of the listing queries so pages are read in index order;
+    # the single-column indexes are prefixes of these and become redundant.
+    # Built CONCURRENTLY outside the migration transaction so writes are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_customer_id_created_at',
+            'orders',
+            ['customer_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_include=['status'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            schema='order_service'
+        )
+        op.create_index(
+            'ix_orders_status_created_at',
+            'orders',
+            ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            schema='order_service'
+        )
+        op.drop_index('ix_orders_customer_id', table_name='orders', postgresql_concurrently=True, if_exists=True, schema='order_service')
+        op.drop_index('ix_orders_status', table_name='orders', postgresql_concurrently=True, if_exists=True, schema='order_service')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_orders_status', 'orders', ['status'], postgresql_concurrently=True, if_not_exists=True, schema='order_service')
+        op.create_index('ix_orders_customer_id', 'orders', ['customer_id'], postgresql_concurrently=True, if_not_exists=True, schema='order_service')
+        op.drop_index('ix_orders_status_created_at', table_name='orders', postgresql_concurrently=True, if_exists=True, schema='order_service')
+        op.drop_index('ix_orders_customer_id_created_at', table_name='orders', postgresql_concurrently=True, if_exists=True, schema='order_service')
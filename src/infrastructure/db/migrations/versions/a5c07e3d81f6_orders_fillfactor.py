@@ -0,0 +1,26 @@
+"""orders fillfactor
+
+Revision ID: a5c07e3d81f6
+Revises: 3f8b6d2c9e14
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c07e3d81f6'
+down_revision: Union[str, None] = '3f8b6d2c9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Leave room in each page so updates of unindexed columns can stay on the page (HOT updates);
+    # applies to pages written from now on
+    op.execute("ALTER TABLE order_service.orders SET (fillfactor = 80)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE order_service.orders RESET (fillfactor)")
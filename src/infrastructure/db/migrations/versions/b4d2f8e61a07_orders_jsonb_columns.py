@@ -0,0 +1,40 @@
+"""orders jsonb columns
+
+Revision ID: b4d2f8e61a07
+Revises: 7c1e4a9b2d53
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d2f8e61a07'
+down_revision: Union[str, None] = '7c1e4a9b2d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSONB is stored decomposed, so reads do not re-parse the text
+    for column in ('delivery_address', 'total'):
+        op.alter_column(
+            'orders',
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb',
+            schema='order_service'
+        )
+
+
+def downgrade() -> None:
+    for column in ('delivery_address', 'total'):
+        op.alter_column(
+            'orders',
+            column,
+            type_=postgresql.JSON(),
+            postgresql_using=f'{column}::json',
+            schema='order_service'
+        )
@@ -0,0 +1,29 @@
+"""created_at server defaults
+
+Revision ID: e93a1c7f4b28
+Revises: b4d2f8e61a07
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e93a1c7f4b28'
+down_revision: Union[str, None] = 'b4d2f8e61a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('customers', 'orders', 'order_items')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.text('now()'), schema='order_service')
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, 'created_at', server_default=None, schema='order_service')
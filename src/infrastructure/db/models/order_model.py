@@ -1,22 +1,21 @@
-import uuid
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, Enum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, Text, Enum, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 
 from src.infrastructure.db.base import Base
 from src.domain.entities.order import OrderStatus
+from src.domain.entities._uuidgen import fast_uuid7
 
 
 class CustomerModel(Base):
     __tablename__ = "customers"
     __table_args__ = {'schema': 'order_service'}
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=fast_uuid7)
     name = Column(String(255), nullable=False)
     email = Column(String(255), nullable=False, unique=True)
     phone = Column(String(50), nullable=False)
-    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, nullable=True)
     
     # Relationships
@@ -28,22 +27,37 @@ class CustomerModel(Base):
 
 class OrderModel(Base):
     __tablename__ = "orders"
-    __table_args__ = {'schema': 'order_service'}
+    # Indexes mirror the Alembic migrations
+    __table_args__ = (
+        Index(
+            'ix_orders_customer_id_created_at',
+            'customer_id', text('created_at DESC'), text('id DESC'),
+            postgresql_include=['status']
+        ),
+        Index('ix_orders_status_created_at', 'status', text('created_at DESC'), text('id DESC')),
+        Index('ix_orders_created_at', 'created_at'),
+        {'schema': 'order_service', 'postgresql_with': {'fillfactor': 80}}
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=fast_uuid7)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("order_service.customers.id"), nullable=False)
-    status = Column(String(50), default=OrderStatus.CREATED.value, nullable=False)
+    status = Column(
+        Enum(*(order_status.value for order_status in OrderStatus), name="order_status", schema="order_service"),
+        default=OrderStatus.CREATED.value,
+        nullable=False
+    )
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, nullable=True)
     
     # JSON columns
-    delivery_address = Column(JSON, nullable=True)
-    total = Column(JSON, nullable=False)
+    delivery_address = Column(JSONB, nullable=True)
+    total = Column(JSONB, nullable=False)
     
     # Relationships
     customer = relationship("CustomerModel", back_populates="orders")
-    items = relationship("OrderItemModel", back_populates="order", cascade="all, delete-orphan")
+    # Lazy loading cannot run under AsyncSession, so items always come with their order
+    items = relationship("OrderItemModel", back_populates="order", cascade="all, delete-orphan", lazy="selectin")
     
     def __repr__(self):
         return f"<Order {self.id}>"
@@ -51,9 +65,14 @@ class OrderModel(Base):
 
 class OrderItemModel(Base):
     __tablename__ = "order_items"
-    __table_args__ = {'schema': 'order_service'}
+    # Indexes mirror the Alembic migrations
+    __table_args__ = (
+        Index('ix_order_items_order_id', 'order_id'),
+        Index('ix_order_items_product_id', 'product_id'),
+        {'schema': 'order_service'}
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=fast_uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey("order_service.orders.id"), nullable=False)
     product_id = Column(UUID(as_uuid=True), nullable=False)
     name = Column(String(255), nullable=False)
@@ -61,7 +80,7 @@ class OrderItemModel(Base):
     unit_price = Column(Float, nullable=False)
     total_price = Column(Float, nullable=False)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     order = relationship("OrderModel", back_populates="items")
@@ -1,33 +1,66 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict
 
-from src.infrastructure.config.settings import get_settings
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
 
-settings = get_settings()
+from src.infrastructure.config.settings import Settings, get_settings
 
-# Create async engine
-engine = create_async_engine(
-    settings.ORDER_DATABASE_URL,
-    echo=settings.DB_ECHO,
-    future=True
-)
 
-# Create session factory
-async_session_factory = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
-)
+def _connect_args(settings: Settings) -> Dict[str, Any]:
+    """asyncpg connection options"""
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "server_settings": {"jit": "on" if settings.DB_JIT else "off"}
+    }
 
 
-async def get_db_session() -> AsyncSession:
+@lru_cache()
+def get_engine() -> AsyncEngine:
+    """Create the async engine on first use, so importing this module opens no pool"""
+    settings = get_settings()
+    
+    if settings.TESTING:
+        # Tests open a connection per session and keep nothing alive between them
+        return create_async_engine(
+            settings.ORDER_DATABASE_URL,
+            echo=settings.DB_ECHO,
+            future=True,
+            connect_args=_connect_args(settings),
+            poolclass=NullPool
+        )
+    
+    return create_async_engine(
+        settings.ORDER_DATABASE_URL,
+        echo=settings.DB_ECHO,
+        future=True,
+        connect_args=_connect_args(settings),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        # LIFO reuses the most recently returned connections so idle overflow ones can time out
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE
+    )
+
+
+@lru_cache()
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to the shared engine"""
+    return async_sessionmaker(
+        get_engine(),
+        expire_on_commit=False
+    )
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async DB session
     """
-    async with async_session_factory() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
\ No newline at end of file
+    # The context manager closes the session
+    async with get_sessionmaker()() as session:
+        yield session
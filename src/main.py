@@ -1,5 +1,7 @@
+import asyncio
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from contextlib import asynccontextmanager
@@ -7,7 +9,9 @@ from contextlib import asynccontextmanager
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.adapters.input.api.order_router import router as order_router
 from src.infrastructure.adapters.input.api.error_handler import setup_error_handlers
-from src.infrastructure.adapters.output.messaging.kafka_event_publisher import KafkaEventPublisher
+from src.infrastructure.adapters.output.messaging.event_outbox import get_event_outbox
+from src.infrastructure.adapters.output.services.inventory_service import get_inventory_service
+from src.infrastructure.adapters.output.cache.redis_order_cache import get_order_cache
 
 
 # Configure logging
@@ -20,28 +24,46 @@ logger = logging.getLogger(__name__)
 # Get application settings
 settings = get_settings()
 
-# Kafka event publisher
-kafka_publisher = KafkaEventPublisher()
+# Kafka event publisher, queueing events for a background worker
+kafka_publisher = get_event_outbox()
 
-# Define FastAPI lifespan
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    logger.info("Starting up the application...")
+# Inventory service with a connection pool shared by all requests
+inventory_service = get_inventory_service()
+
+# Order read cache
+order_cache = get_order_cache()
+
+async def start_kafka_publisher() -> None:
+    """Connect the Kafka producer; if it fails, the outbox worker retries when sending"""
     try:
         await kafka_publisher.start()
         logger.info("Kafka producer started successfully")
     except Exception as e:
         logger.error(f"Failed to start Kafka producer: {str(e)}")
 
+# Define FastAPI lifespan
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting up the application...")
+    # Fetching the broker metadata can take seconds, so do not hold up serving requests
+    app.state.kafka_start_task = asyncio.create_task(start_kafka_publisher())
+
+    await inventory_service.start()
+    await order_cache.start()
+
     yield  # Aquí corre la app
 
     logger.info("Shutting down the application...")
+    await app.state.kafka_start_task
     try:
         await kafka_publisher.stop()
         logger.info("Kafka producer stopped successfully")
     except Exception as e:
         logger.error(f"Error stopping Kafka producer: {str(e)}")
 
+    await inventory_service.stop()
+    await order_cache.stop()
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
@@ -49,13 +71,14 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
-    root_path="/order"
+    root_path="/order",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -77,4 +100,12 @@ async def health_check():
 if __name__ == "__main__":
     import uvicorn
     
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.DEBUG,
+        workers=settings.WEB_CONCURRENCY
+    )
\ No newline at end of file
@@ -0,0 +1,4 @@
+import os
+
+# Use the test configuration (e.g. no connection pool) for everything imported by the suite
+os.environ.setdefault("TESTING", "1")
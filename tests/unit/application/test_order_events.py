@@ -0,0 +1,69 @@
+# tests/unit/application/test_order_events.py
+import json
+import uuid
+import pytest
+from datetime import datetime
+
+from src.domain.entities.order_item import OrderItem
+from src.application.events.order_events import (
+    OrderCancelledEvent,
+    OrderCreatedEvent,
+    OrderConfirmedEvent
+)
+
+
+def test_event_to_bytes_contains_all_fields():
+    """Test that the JSON message includes base and subclass fields"""
+    order_id = uuid.uuid4()
+    customer_id = uuid.uuid4()
+    event = OrderCancelledEvent.create(order_id=order_id, customer_id=customer_id, reason="No stock")
+
+    payload = json.loads(event.to_bytes())
+
+    assert payload == {
+        "event_id": str(event.event_id),
+        "event_type": "order.cancelled",
+        "timestamp": event.timestamp.isoformat(),
+        "version": "1.0",
+        "order_id": str(order_id),
+        "customer_id": str(customer_id),
+        "reason": "No stock"
+    }
+
+
+def test_event_keeps_native_types():
+    """Test that identifiers and timestamps are not stringified before the publisher"""
+    event = OrderConfirmedEvent.create(order_id=uuid.uuid4(), customer_id=uuid.uuid4(), total_amount=22.0)
+
+    assert isinstance(event.event_id, uuid.UUID)
+    assert isinstance(event.order_id, uuid.UUID)
+    assert isinstance(event.timestamp, datetime)
+
+
+def test_event_is_immutable():
+    """Test that events cannot be modified after creation"""
+    event = OrderConfirmedEvent.create(order_id=uuid.uuid4(), customer_id=uuid.uuid4(), total_amount=22.0)
+
+    with pytest.raises(Exception):  # pydantic ValidationError on frozen models
+        event.total_amount = 0
+
+
+def test_order_created_event_reads_items_from_entities():
+    """Test that order items are serialized straight from OrderItem entities"""
+    item = OrderItem.create(product_id=uuid.uuid4(), name="Test Product", quantity=2, unit_price=10.0)
+    event = OrderCreatedEvent.create(
+        order_id=uuid.uuid4(),
+        customer_id=uuid.uuid4(),
+        items=[item],
+        total_amount=22.0,
+        status="CREATED"
+    )
+
+    assert json.loads(event.to_bytes())["items"] == [{
+        "id": str(item.id),
+        "product_id": str(item.product_id),
+        "name": "Test Product",
+        "quantity": 2,
+        "unit_price": 10.0,
+        "total_price": 20.0
+    }]
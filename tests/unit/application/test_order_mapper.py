@@ -0,0 +1,112 @@
+# tests/unit/application/test_order_mapper.py
+import uuid
+from dataclasses import asdict
+from datetime import datetime
+
+from src.application.dtos.customer_dto import CustomerDTO
+from src.application.dtos.order_dto import OrderDTO, DeliveryAddressDTO
+from src.application.dtos.order_item_dto import OrderItemDTO
+from src.application.mappers.order_mapper import OrderMapper
+from src.domain.entities.order import Order
+from src.domain.entities.order_item import OrderItem
+from src.domain.value_objects.delivery_address import DeliveryAddress
+
+
+def test_to_entity_maps_typed_items():
+    """Test that OrderItemDTO items are mapped to OrderItem entities"""
+    item_id = uuid.uuid4()
+    product_id = uuid.uuid4()
+    order_dto = OrderDTO(
+        id=uuid.uuid4(),
+        customer_id=uuid.uuid4(),
+        items=[OrderItemDTO(id=item_id, product_id=product_id, name="A", quantity=1, unit_price=5.0)]
+    )
+
+    order = OrderMapper.to_entity(order_dto)
+
+    assert order.items[0].id == item_id
+    assert order.items[0].product_id == product_id
+
+
+def test_to_entity_computes_missing_item_total_price():
+    """Test that total_price defaults to quantity * unit_price"""
+    order_dto = OrderDTO(
+        id=uuid.uuid4(),
+        customer_id=uuid.uuid4(),
+        items=[OrderItemDTO(product_id=uuid.uuid4(), name="A", quantity=3, unit_price=2.5)]
+    )
+
+    order = OrderMapper.to_entity(order_dto)
+
+    assert order.items[0].id is not None
+    assert order.items[0].total_price == 7.5
+
+
+def test_to_entity_generates_missing_ids():
+    """Test that orders and customers without an id get a fresh one"""
+    order = OrderMapper.to_entity(OrderDTO(customer_id=uuid.uuid4()))
+    customer = OrderMapper.customer_to_entity(CustomerDTO(name="Ana", email="ana@example.com"))
+
+    assert isinstance(order.id, uuid.UUID)
+    assert isinstance(customer.id, uuid.UUID)
+
+
+def test_to_dto_maps_items_to_item_dtos():
+    """Test that order items are mapped to OrderItemDTO instances"""
+    item = OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=2, unit_price=10.0)
+    order = Order(id=uuid.uuid4(), customer_id=uuid.uuid4(), items=[item], created_at=datetime.now())
+
+    order_dto = OrderMapper.to_dto(order)
+
+    assert order_dto.items == [OrderMapper.order_item_to_dto(item)]
+    assert isinstance(order_dto.items[0], OrderItemDTO)
+
+
+def test_to_dto_keeps_item_created_at_as_datetime():
+    """Test that item timestamps are left for the JSON boundary to format"""
+    item = OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=1, unit_price=1.0)
+    order = Order(id=uuid.uuid4(), customer_id=uuid.uuid4(), items=[item])
+
+    order_dto = OrderMapper.to_dto(order)
+
+    assert isinstance(order_dto.items[0].created_at, datetime)
+
+
+def test_to_dto_reuses_equal_delivery_addresses():
+    """Test that equal delivery addresses map to one shared DTO instance"""
+    def make_order():
+        address = DeliveryAddress(
+            street="123 Main St",
+            city="Test City",
+            state="Test State",
+            postal_code="12345",
+            country="Test Country"
+        )
+        return Order(id=uuid.uuid4(), customer_id=uuid.uuid4(), delivery_address=address)
+
+    first = OrderMapper.to_dto(make_order())
+    second = OrderMapper.to_dto(make_order())
+
+    assert first.delivery_address == DeliveryAddressDTO(
+        street="123 Main St",
+        city="Test City",
+        state="Test State",
+        postal_code="12345",
+        country="Test Country"
+    )
+    assert first.delivery_address is second.delivery_address
+
+
+def test_to_primitive_matches_dto_serialization():
+    """Test that the direct serialization path matches asdict of the DTO"""
+    item = OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=2, unit_price=10.0)
+    address = DeliveryAddress(
+        street="123 Main St",
+        city="Test City",
+        state="Test State",
+        postal_code="12345",
+        country="Test Country"
+    )
+    order = Order.create(customer_id=uuid.uuid4(), items=[item], delivery_address=address, notes="Ring twice")
+
+    assert OrderMapper.to_primitive(order) == asdict(OrderMapper.to_dto(order))
@@ -2,23 +2,29 @@
 import uuid
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
 from src.domain.value_objects.delivery_address import DeliveryAddress
 from src.domain.value_objects.order_total import OrderTotal
 from src.domain.exceptions.domain_exceptions import OrderNotFoundException
+from src.domain.ports.output.order_repository_port import OrderRepositoryPort
 from src.application.services.order_query_service import OrderQueryService
 
 
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
 # Fixtures
-@pytest.fixture
+@pytest.fixture(scope="module")
 def order_id():
     return uuid.uuid4()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def customer_id():
     return uuid.uuid4()
 
@@ -36,7 +42,7 @@ def order_item():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def delivery_address():
     return DeliveryAddress(
         street="123 Main St",
@@ -86,12 +92,8 @@ def order_list(customer_id, order_item, delivery_address):
 
 @pytest.fixture
 def order_repository():
-    repository = AsyncMock()
-    repository.find_by_id = AsyncMock()
-    repository.find_by_customer_id = AsyncMock()
-    repository.find_by_status = AsyncMock()
-    repository.find_by_date_range = AsyncMock()
-    return repository
+    # The find_by_* iterators are plain methods on the port, so spec makes them MagicMocks
+    return AsyncMock(spec=OrderRepositoryPort)
 
 
 @pytest.fixture
@@ -100,7 +102,6 @@ def order_query_service(order_repository):
 
 
 # Tests
-@pytest.mark.asyncio
 async def test_get_order_by_id_success(
     order_query_service, order, order_id, order_repository
 ):
@@ -120,7 +121,6 @@ async def test_get_order_by_id_success(
     order_repository.find_by_id.assert_called_once_with(order_id)
 
 
-@pytest.mark.asyncio
 async def test_get_orders_by_date_range_with_status(
     order_query_service, order_list, order_repository
 ):
@@ -129,10 +129,10 @@ async def test_get_orders_by_date_range_with_status(
     end_date = datetime.now()
     status = OrderStatus.CONFIRMED
     filtered_orders = [order for order in order_list if order.status == status]
-    order_repository.find_by_date_range.return_value = filtered_orders
+    order_repository.find_by_date_range.return_value = async_iter(filtered_orders)
     
     # Execute
-    result = await order_query_service.get_orders_by_date_range(start_date, end_date, status)
+    result = [order async for order in order_query_service.get_orders_by_date_range(start_date, end_date, status)]
     
     # Assert
     assert result is not None
@@ -140,30 +140,28 @@ async def test_get_orders_by_date_range_with_status(
     assert all(order.status == status for order in result)
     
     # Verify interactions
-    order_repository.find_by_date_range.assert_called_once_with(start_date, end_date, status)
+    order_repository.find_by_date_range.assert_called_once_with(start_date, end_date, status, 50, None)
 
 
-@pytest.mark.asyncio
 async def test_get_orders_by_date_range_empty(
     order_query_service, order_repository
 ):
     # Setup
     start_date = datetime.now() - timedelta(days=2)
     end_date = datetime.now()
-    order_repository.find_by_date_range.return_value = []
+    order_repository.find_by_date_range.return_value = async_iter([])
     
     # Execute
-    result = await order_query_service.get_orders_by_date_range(start_date, end_date)
+    result = [order async for order in order_query_service.get_orders_by_date_range(start_date, end_date)]
     
     # Assert
     assert result is not None
     assert len(result) == 0
     
     # Verify interactions
-    order_repository.find_by_date_range.assert_called_once_with(start_date, end_date, None)
+    order_repository.find_by_date_range.assert_called_once_with(start_date, end_date, None, 50, None)
 
 
-@pytest.mark.asyncio
 async def test_get_order_by_id_not_found(
     order_query_service, order_id, order_repository
 ):
@@ -178,15 +176,14 @@ async def test_get_order_by_id_not_found(
     order_repository.find_by_id.assert_called_once_with(order_id)
 
 
-@pytest.mark.asyncio
 async def test_get_orders_by_customer_id(
     order_query_service, customer_id, order_list, order_repository
 ):
     # Setup
-    order_repository.find_by_customer_id.return_value = order_list
+    order_repository.find_by_customer_id.return_value = async_iter(order_list)
     
     # Execute
-    result = await order_query_service.get_orders_by_customer_id(customer_id)
+    result = [order async for order in order_query_service.get_orders_by_customer_id(customer_id)]
     
     # Assert
     assert result is not None
@@ -194,38 +191,36 @@ async def test_get_orders_by_customer_id(
     assert all(order.customer_id == customer_id for order in result)
     
     # Verify interactions
-    order_repository.find_by_customer_id.assert_called_once_with(customer_id)
+    order_repository.find_by_customer_id.assert_called_once_with(customer_id, 50, None)
 
 
-@pytest.mark.asyncio
 async def test_get_orders_by_customer_id_empty(
     order_query_service, customer_id, order_repository
 ):
     # Setup
-    order_repository.find_by_customer_id.return_value = []
+    order_repository.find_by_customer_id.return_value = async_iter([])
     
     # Execute
-    result = await order_query_service.get_orders_by_customer_id(customer_id)
+    result = [order async for order in order_query_service.get_orders_by_customer_id(customer_id)]
     
     # Assert
     assert result is not None
     assert len(result) == 0
     
     # Verify interactions
-    order_repository.find_by_customer_id.assert_called_once_with(customer_id)
+    order_repository.find_by_customer_id.assert_called_once_with(customer_id, 50, None)
 
 
-@pytest.mark.asyncio
 async def test_get_orders_by_status(
     order_query_service, order_list, order_repository
 ):
     # Setup
     status = OrderStatus.CONFIRMED
     filtered_orders = [order for order in order_list if order.status == status]
-    order_repository.find_by_status.return_value = filtered_orders
+    order_repository.find_by_status.return_value = async_iter(filtered_orders)
     
     # Execute
-    result = await order_query_service.get_orders_by_status(status)
+    result = [order async for order in order_query_service.get_orders_by_status(status)]
     
     # Assert
     assert result is not None
@@ -233,20 +228,19 @@ async def test_get_orders_by_status(
     assert all(order.status == status for order in result)
     
     # Verify interactions
-    order_repository.find_by_status.assert_called_once_with(status)
+    order_repository.find_by_status.assert_called_once_with(status, 50, None)
 
 
-@pytest.mark.asyncio
 async def test_get_orders_by_date_range(
     order_query_service, order_list, order_repository
 ):
     # Setup
     start_date = datetime.now() - timedelta(days=2)
     end_date = datetime.now()
-    order_repository.find_by_date_range.return_value = order_list
+    order_repository.find_by_date_range.return_value = async_iter(order_list)
     
     # Execute
-    result = await order_query_service.get_orders_by_date_range(start_date, end_date)
+    result = [order async for order in order_query_service.get_orders_by_date_range(start_date, end_date)]
     
     # Assert
     assert result is not None
@@ -2,33 +2,34 @@
 import uuid
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
-from src.domain.entities.customer import Customer
 from src.domain.value_objects.delivery_address import DeliveryAddress
 from src.domain.value_objects.order_total import OrderTotal
 from src.domain.exceptions.domain_exceptions import (
     OrderNotFoundException,
-    InventoryValidationException,
-    InvalidOrderStateException
+    InventoryValidationException
 )
+from src.domain.ports.output.order_repository_port import OrderRepositoryPort
+from src.domain.ports.output.inventory_service_port import InventoryServicePort
+from src.domain.ports.output.event_publisher_port import EventPublisherPort
 from src.application.services.order_service import OrderService
 
 
 # Fixtures
-@pytest.fixture
+@pytest.fixture(scope="module")
 def order_id():
     return uuid.uuid4()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def customer_id():
     return uuid.uuid4()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def product_id():
     return uuid.uuid4()
 
@@ -46,7 +47,7 @@ def order_item(product_id):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def delivery_address():
     return DeliveryAddress(
         street="123 Main St",
@@ -72,25 +73,17 @@ def order(order_id, customer_id, order_item, delivery_address):
 
 @pytest.fixture
 def order_repository():
-    repository = AsyncMock()
-    repository.save = AsyncMock()
-    repository.find_by_id = AsyncMock()
-    repository.update = AsyncMock()
-    return repository
+    return AsyncMock(spec=OrderRepositoryPort)
 
 
 @pytest.fixture
 def inventory_service():
-    service = AsyncMock()
-    service.validate_items_availability = AsyncMock()
-    return service
+    return AsyncMock(spec=InventoryServicePort)
 
 
 @pytest.fixture
 def event_publisher():
-    publisher = AsyncMock()
-    publisher.publish_event = AsyncMock()
-    return publisher
+    return AsyncMock(spec=EventPublisherPort)
 
 
 @pytest.fixture
@@ -103,14 +96,13 @@ def order_service(order_repository, inventory_service, event_publisher):#
 
 
 # Tests
-@pytest.mark.asyncio
 async def test_create_order_success( 
     order_service, customer_id, order_item, delivery_address,
     order_repository, inventory_service,event_publisher
 ):
     # Setup
     items = [order_item]
-    inventory_service.validate_items_availability.return_value = {order_item.product_id: True}
+    inventory_service.validate_items_availability.return_value = (frozenset({order_item.product_id}), frozenset())
     order_repository.save.return_value = Order(
         id=uuid.uuid4(),
         customer_id=customer_id,
@@ -139,16 +131,16 @@ async def test_create_order_success(
     inventory_service.validate_items_availability.assert_called_once_with(items)
     order_repository.save.assert_called_once()
     event_publisher.publish_event.assert_called_once()
+    assert event_publisher.publish_event.call_args.kwargs["key"] == result.id
 
 
-@pytest.mark.asyncio
 async def test_create_order_inventory_unavailable(
     order_service, customer_id, order_item, delivery_address,
     inventory_service
 ):
     # Setup
     items = [order_item]
-    inventory_service.validate_items_availability.return_value = {order_item.product_id: False}
+    inventory_service.validate_items_availability.return_value = (frozenset(), frozenset({order_item.product_id}))
     
     # Execute and Assert
     with pytest.raises(InventoryValidationException):
@@ -162,14 +154,13 @@ async def test_create_order_inventory_unavailable(
     inventory_service.validate_items_availability.assert_called_once_with(items)
 
 
-@pytest.mark.asyncio
 async def test_confirm_order_success(#
     order_service, order, order_id,
     order_repository, inventory_service, event_publisher
 ):
     # Setup
     order_repository.find_by_id.return_value = order
-    inventory_service.validate_items_availability.return_value = {order.items[0].product_id: True}
+    inventory_service.validate_items_availability.return_value = (frozenset({order.items[0].product_id}), frozenset())
     order_repository.update.return_value = Order(
         id=order.id,
         customer_id=order.customer_id,
@@ -193,10 +184,37 @@ async def test_confirm_order_success(#
     order_repository.find_by_id.assert_called_once_with(order_id)
     inventory_service.validate_items_availability.assert_called_once_with(order.items)
     order_repository.update.assert_called_once()
-    assert event_publisher.publish_event.call_count == 2  # Two events: status updated and order confirmed
+    event_publisher.publish_events.assert_called_once()
+    published_events = event_publisher.publish_events.call_args.args[0]
+    assert [event_type for event_type, _ in published_events] == ["order.status_updated", "order.confirmed"]
+    assert event_publisher.publish_events.call_args.kwargs["key"] == order_id
+
+
+async def test_confirm_order_already_confirmed_is_a_no_op(
+    order_service, order, order_id,
+    order_repository, inventory_service, event_publisher
+):
+    # Setup
+    order_repository.find_by_id.return_value = Order(
+        id=order.id,
+        customer_id=order.customer_id,
+        items=order.items,
+        status=OrderStatus.CONFIRMED,
+        delivery_address=order.delivery_address,
+        total=order.total,
+        created_at=order.created_at
+    )
+    
+    # Execute
+    result = await order_service.confirm_order(order_id)
+    
+    # Assert
+    assert result.status == OrderStatus.CONFIRMED
+    inventory_service.validate_items_availability.assert_not_called()
+    order_repository.update.assert_not_called()
+    event_publisher.publish_events.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_confirm_order_not_found(
     order_service, order_id, order_repository
 ):
@@ -211,10 +229,9 @@ async def test_confirm_order_not_found(
     order_repository.find_by_id.assert_called_once_with(order_id)
 
 
-@pytest.mark.asyncio
-async def test_cancel_order_success(#, event_publisher
+async def test_cancel_order_success(
     order_service, order, order_id,
-    order_repository
+    order_repository, event_publisher
 ):
     # Setup
     order_repository.find_by_id.return_value = order
@@ -241,4 +258,64 @@ async def test_cancel_order_success(#, event_publisher
     # Verify interactions
     order_repository.find_by_id.assert_called_once_with(order_id)
     order_repository.update.assert_called_once()
-    event_publisher.publish_event.assert_called_once()
\ No newline at end of file
+    event_publisher.publish_event.assert_called_once()
+
+
+async def test_add_items_to_order_validates_once(
+    order_service, order, order_id,
+    order_repository, inventory_service
+):
+    # Setup
+    new_items = [
+        OrderItem.create(product_id=uuid.uuid4(), name="Extra 1", quantity=1, unit_price=5.0),
+        OrderItem.create(product_id=uuid.uuid4(), name="Extra 2", quantity=3, unit_price=2.0)
+    ]
+    order_repository.find_by_id.return_value = order
+    inventory_service.validate_items_availability.return_value = (frozenset(item.product_id for item in new_items), frozenset())
+    order_repository.update.side_effect = lambda updated: updated
+    
+    # Execute
+    result = await order_service.add_items_to_order(order_id, new_items)
+    
+    # Assert
+    assert len(result.items) == 3
+    assert result.total.subtotal == 31.0
+    
+    # Verify interactions
+    inventory_service.validate_items_availability.assert_called_once_with(new_items)
+    order_repository.update.assert_called_once()
+
+
+async def test_add_items_to_order_inventory_unavailable(
+    order_service, order, order_id,
+    order_repository, inventory_service
+):
+    # Setup
+    new_items = [OrderItem.create(product_id=uuid.uuid4(), name="Extra", quantity=1, unit_price=5.0)]
+    order_repository.find_by_id.return_value = order
+    inventory_service.validate_items_availability.return_value = (frozenset(), frozenset({new_items[0].product_id}))
+    
+    # Execute and Assert
+    with pytest.raises(InventoryValidationException):
+        await order_service.add_items_to_order(order_id, new_items)
+    
+    order_repository.update.assert_not_called()
+
+
+async def test_update_order_status_same_status_is_noop(
+    order_service, order, order_id,
+    order_repository, event_publisher
+):
+    # Setup
+    order_repository.find_by_id.return_value = order
+    
+    # Execute
+    result = await order_service.update_order_status(order_id, order.status)
+    
+    # Assert
+    assert result is order
+    assert result.updated_at is None
+    
+    # Verify interactions
+    order_repository.update.assert_not_called()
+    event_publisher.publish_event.assert_not_called()
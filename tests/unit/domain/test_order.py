@@ -0,0 +1,145 @@
+# Tests for Order entity
+import uuid
+import pytest
+from datetime import datetime
+from src.domain.entities.order import Order, OrderStatus
+from src.domain.entities.order_item import OrderItem
+
+
+@pytest.fixture
+def order():
+    return Order.create(
+        customer_id=uuid.uuid4(),
+        items=[OrderItem.create(product_id=uuid.uuid4(), name="Base", quantity=2, unit_price=10.0)]
+    )
+
+
+def test_add_item_updates_totals(order):
+    """Test that adding an item updates subtotal, tax and total"""
+    order.add_item(OrderItem.create(product_id=uuid.uuid4(), name="Extra", quantity=1, unit_price=5.0))
+
+    assert len(order.items) == 2
+    assert order.total.subtotal == pytest.approx(25.0)
+    assert order.total.tax == pytest.approx(2.5)
+    assert order.total.total == pytest.approx(27.5)
+
+
+def test_remove_item_updates_totals(order):
+    """Test that removing an item subtracts its price from the totals"""
+    extra = OrderItem.create(product_id=uuid.uuid4(), name="Extra", quantity=1, unit_price=5.0)
+    order.add_item(extra)
+
+    order.remove_item(extra.id)
+
+    assert [item.name for item in order.items] == ["Base"]
+    assert order.total.subtotal == pytest.approx(20.0)
+    assert order.total.total == pytest.approx(22.0)
+
+
+def test_remove_unknown_item_keeps_totals(order):
+    """Test that removing a missing item leaves the order unchanged"""
+    total = order.total
+
+    order.remove_item(uuid.uuid4())
+
+    assert len(order.items) == 1
+    assert order.total == total
+
+
+def test_add_item_rejected_when_not_mutable(order):
+    """Test that items cannot be added once the order is confirmed"""
+    order.update_status(OrderStatus.CONFIRMED)
+
+    with pytest.raises(ValueError):
+        order.add_item(OrderItem.create(product_id=uuid.uuid4(), name="Extra", quantity=1, unit_price=5.0))
+
+
+def test_order_item_created_at_defaults_per_instance():
+    """Test that created_at is evaluated per item, not once at import"""
+    before = datetime.now()
+    item = OrderItem(
+        id=uuid.uuid4(),
+        product_id=uuid.uuid4(),
+        name="Test Product",
+        quantity=1,
+        unit_price=1.0,
+        total_price=1.0
+    )
+
+    assert item.created_at >= before
+
+
+def test_order_item_create_shares_given_timestamp():
+    """Test that a batch of items can share one creation timestamp"""
+    now = datetime.now()
+    items = [OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=1, unit_price=1.0, now=now) for _ in range(3)]
+
+    assert all(item.created_at is now for item in items)
+
+
+def test_create_and_status_changes_use_given_timestamp():
+    """Test that a shared request timestamp is used instead of reading the clock"""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    order = Order.create(customer_id=uuid.uuid4(), now=now)
+
+    assert order.created_at == now
+
+    order.update_status(OrderStatus.PENDING, now=now)
+    assert order.updated_at == now
+
+    order.cancel(now=now)
+    assert order.updated_at == now
+
+
+def test_totals_are_exact_in_cents():
+    """Test that totals do not accumulate float drift"""
+    items = [OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=1, unit_price=0.1) for _ in range(3)]
+    order = Order.create(customer_id=uuid.uuid4(), items=items)
+
+    assert order.total.subtotal == 0.3
+    assert order.total.tax == 0.03
+    assert order.total.total == 0.33
+
+    order.remove_item(items[0].id)
+    assert order.total.subtotal == 0.2
+
+
+def test_item_and_tax_cents_round_half_up():
+    """Test that item prices and tax use the same half-up rounding"""
+    item = OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=2, unit_price=0.125)
+    order = Order.create(customer_id=uuid.uuid4(), items=[item])
+
+    assert item.total_price_cents == 26
+    assert order.total.subtotal == 0.26
+    assert order.total.tax == 0.03
+
+
+def test_remove_item_after_items_list_replaced(order):
+    """Test that replacing items with a list of the same length does not leave a stale index"""
+    original = order.items[0]
+    replacement = OrderItem.create(product_id=uuid.uuid4(), name="Other", quantity=1, unit_price=5.0)
+    order.items = [replacement]
+
+    order.remove_item(original.id)
+    assert order.items == [replacement]
+
+    order.remove_item(replacement.id)
+    assert order.items == []
+    assert order.total.subtotal == 0
+
+
+def test_order_items_compare_by_id():
+    """Test that order items are equal and hash alike when their ids match"""
+    item = OrderItem.create(product_id=uuid.uuid4(), name="A", quantity=1, unit_price=1.0)
+    renamed = OrderItem(
+        id=item.id,
+        product_id=item.product_id,
+        name="B",
+        quantity=2,
+        unit_price=1.0,
+        total_price=2.0
+    )
+
+    assert item == renamed
+    assert len({item, renamed}) == 1
+    assert item != OrderItem.create(product_id=item.product_id, name="A", quantity=1, unit_price=1.0)
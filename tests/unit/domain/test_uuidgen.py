@@ -0,0 +1,20 @@
+# Tests for the buffered UUID generator
+import time
+
+from src.domain.entities._uuidgen import fast_uuid7
+
+
+def test_fast_uuid7_is_version_7_and_time_ordered():
+    """Test that UUIDv7 values carry version 7 and sort by creation millisecond"""
+    first = fast_uuid7()
+    time.sleep(0.002)
+    second = fast_uuid7()
+    assert first.version == 7
+    assert first.variant == "specified in RFC 4122"
+    assert first < second
+
+
+def test_fast_uuid7_is_unique_across_buffer_refills():
+    """Test that UUIDs stay unique when the random buffer is refilled"""
+    values = {fast_uuid7() for _ in range(1000)}
+    assert len(values) == 1000
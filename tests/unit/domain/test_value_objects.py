@@ -4,48 +4,58 @@ from src.domain.value_objects.delivery_address import DeliveryAddress
 from src.domain.value_objects.order_total import OrderTotal
 
 
-def test_order_total_create():
+@pytest.fixture(scope="module")
+def sample_total():
+    return OrderTotal(subtotal=100.0, tax=10.0, total=110.0)
+
+
+@pytest.fixture(scope="module")
+def sample_address():
+    return DeliveryAddress(
+        street="123 Main St",
+        city="Test City",
+        state="Test State",
+        postal_code="12345",
+        country="Test Country"
+    )
+
+
+@pytest.mark.parametrize("attr, expected", [("subtotal", 100.0), ("tax", 10.0), ("total", 110.0)])
+def test_order_total_create(sample_total, attr, expected):
     """Test creating an order total"""
-    total = OrderTotal(subtotal=100.0, tax=10.0, total=110.0)
-    assert total.subtotal == 100.0
-    assert total.tax == 10.0
-    assert total.total == 110.0
+    assert getattr(sample_total, attr) == expected
 
 
-def test_order_total_str_representation():
+def test_order_total_str_representation(sample_total):
     """Test string representation of order total"""
-    total = OrderTotal(subtotal=100.0, tax=10.0, total=110.0)
-    str_repr = str(total)
+    str_repr = str(sample_total)
     assert "Total: $110.00" in str_repr
     assert "Subtotal: $100.00" in str_repr
     assert "Tax: $10.00" in str_repr
 
 
-def test_order_total_immutability():
+def test_order_total_immutability(sample_total):
     """Test that order total is immutable"""
-    total = OrderTotal(subtotal=100.0, tax=10.0, total=110.0)
     with pytest.raises(Exception):  # Either AttributeError or dataclasses.FrozenInstanceError
-        total.subtotal = 200.0
+        sample_total.subtotal = 200.0
 
 
 # Tests for DeliveryAddress value object
-def test_delivery_address_create():
+@pytest.mark.parametrize(
+    "attr, expected",
+    [
+        ("street", "123 Main St"),
+        ("city", "Test City"),
+        ("state", "Test State"),
+        ("postal_code", "12345"),
+        ("country", "Test Country"),
+        ("apartment", None),
+        ("instructions", None)
+    ]
+)
+def test_delivery_address_create(sample_address, attr, expected):
     """Test creating a delivery address"""
-    address = DeliveryAddress(
-        street="123 Main St",
-        city="Test City",
-        state="Test State",
-        postal_code="12345",
-        country="Test Country"
-    )
-    
-    assert address.street == "123 Main St"
-    assert address.city == "Test City"
-    assert address.state == "Test State"
-    assert address.postal_code == "12345"
-    assert address.country == "Test Country"
-    assert address.apartment is None
-    assert address.instructions is None
+    assert getattr(sample_address, attr) == expected
 
 
 def test_delivery_address_create_with_optional_fields():
@@ -64,17 +74,9 @@ def test_delivery_address_create_with_optional_fields():
     assert address.instructions == "Leave at front door"
 
 
-def test_delivery_address_str_representation():
+def test_delivery_address_str_representation(sample_address):
     """Test string representation of delivery address"""
-    address = DeliveryAddress(
-        street="123 Main St",
-        city="Test City",
-        state="Test State",
-        postal_code="12345",
-        country="Test Country"
-    )
-    
-    str_repr = str(address)
+    str_repr = str(sample_address)
     assert "123 Main St" in str_repr
     assert "Test City" in str_repr
     assert "Test State" in str_repr
@@ -97,15 +99,39 @@ def test_delivery_address_str_representation_with_apartment():
     assert "Apt 4B" in str_repr
 
 
-def test_delivery_address_immutability():
+def test_delivery_address_immutability(sample_address):
     """Test that delivery address is immutable"""
-    address = DeliveryAddress(
+    with pytest.raises(Exception):  # Either AttributeError or dataclasses.FrozenInstanceError
+        sample_address.street = "456 New St"
+
+
+def test_delivery_address_from_dict():
+    """Test creating a delivery address from a dictionary with missing optional fields"""
+    address = DeliveryAddress.from_dict({
+        "street": "123 Main St",
+        "city": "Test City",
+        "state": "Test State",
+        "postal_code": "12345",
+        "country": "Test Country",
+        "instructions": "Leave at front door"
+    })
+    
+    assert address == DeliveryAddress(
         street="123 Main St",
         city="Test City",
         state="Test State",
         postal_code="12345",
-        country="Test Country"
+        country="Test Country",
+        instructions="Leave at front door"
     )
+    assert address.apartment is None
+
+
+def test_order_total_cached_str_not_in_repr_or_equality():
+    """Test that the cached string does not leak into repr, equality or hashing"""
+    first = OrderTotal(subtotal=100.0, tax=10.0, total=110.0)
+    second = OrderTotal(subtotal=100.0, tax=10.0, total=110.0)
     
-    with pytest.raises(Exception):  # Either AttributeError or dataclasses.FrozenInstanceError
-        address.street = "456 New St"
\ No newline at end of file
+    assert first == second
+    assert hash(first) == hash(second)
+    assert "_str" not in repr(first)
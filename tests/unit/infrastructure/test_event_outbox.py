@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from src.infrastructure.adapters.output.messaging.event_outbox import EventOutbox
+from src.infrastructure.adapters.output.messaging.kafka_event_publisher import KafkaEventPublisher
+
+
+def delivered():
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return future
+
+
+@pytest.fixture
+def outbox():
+    settings = SimpleNamespace(
+        KAFKA_ORDER_TOPIC="orders",
+        KAFKA_OUTBOX_MAX_SIZE=100,
+        KAFKA_OUTBOX_BATCH_SIZE=10,
+        KAFKA_OUTBOX_MAX_RETRIES=2,
+        KAFKA_OUTBOX_RETRY_BACKOFF_MS=0,
+        KAFKA_OUTBOX_MAX_FAILED=10
+    )
+    outbox = EventOutbox(settings)
+    outbox.producer = AsyncMock()
+    outbox.producer.send.side_effect = lambda **kwargs: delivered()
+    return outbox
+
+
+async def test_publish_event_returns_before_sending(outbox):
+    # Setup
+    producer = outbox.producer
+    await outbox.start()
+    key = uuid.uuid4()
+    
+    # Execute
+    await outbox.publish_event("order.created", b"{}", key=key)
+    
+    # Assert
+    outbox.producer.send.assert_not_called()
+    await outbox.stop()
+    producer.send.assert_called_once_with(topic="orders", value=b"{}", key=key)
+
+
+async def test_publish_events_are_sent_in_order(outbox):
+    # Setup
+    producer = outbox.producer
+    await outbox.start()
+    events = [(f"event.{i}", str(i).encode()) for i in range(25)]
+    key = uuid.uuid4()
+    
+    # Execute
+    await outbox.publish_events(events, key=key)
+    await outbox.stop()
+    
+    # Assert
+    sent = [(call.kwargs["value"], call.kwargs["key"]) for call in producer.send.call_args_list]
+    assert sent == [(payload, key) for _, payload in events]
+
+
+async def test_acknowledged_event_waits_behind_queued_events(outbox):
+    # Setup
+    producer = outbox.producer
+    await outbox.start()
+    key = uuid.uuid4()
+    
+    # Execute
+    await outbox.publish_event("order.status_updated", b"1", key=key)
+    await outbox.publish_event("order.confirmed", b"2", key=key, wait_for_ack=True)
+    
+    # Assert
+    sent = [call.kwargs["value"] for call in producer.send.call_args_list]
+    assert sent == [b"1", b"2"]
+    await outbox.stop()
+
+
+async def test_failed_event_is_retried(outbox):
+    # Setup
+    producer = outbox.producer
+    await outbox.start()
+    outbox.producer.send.side_effect = [RuntimeError("broker down"), delivered()]
+    
+    # Execute
+    await outbox.publish_event("order.cancelled", b"1", wait_for_ack=True)
+    await outbox.stop()
+    
+    # Assert
+    assert producer.send.call_count == 2
+    assert not outbox.failed_events
+
+
+async def test_event_is_kept_when_retries_run_out(outbox):
+    # Setup
+    producer = outbox.producer
+    await outbox.start()
+    outbox.producer.send.side_effect = RuntimeError("broker down")
+    
+    # Execute and Assert
+    with pytest.raises(RuntimeError):
+        await outbox.publish_event("order.cancelled", b"1", wait_for_ack=True)
+    assert producer.send.call_count == 3
+    assert [entry[:2] for entry in outbox.failed_events] == [("order.cancelled", b"1")]
+    
+    # The worker keeps sending later events and then re-sends the failed one
+    outbox.producer.send.side_effect = lambda **kwargs: delivered()
+    await outbox.publish_event("order.cancelled", b"2", wait_for_ack=True)
+    await outbox.stop()
+    assert producer.send.call_args.kwargs["value"] == b"1"
+    assert not outbox.failed_events
+
+
+async def test_publish_event_does_not_connect_on_the_request_path(outbox):
+    # Setup
+    outbox.producer = None
+    connect = AsyncMock(side_effect=ConnectionError("broker down"))
+    
+    with patch.object(KafkaEventPublisher, "start", connect):
+        # Execute
+        await outbox.publish_event("order.created", b"1")
+        
+        # Assert
+        connect.assert_not_called()
+        await outbox.stop()
+    assert [entry[:2] for entry in outbox.failed_events] == [("order.created", b"1")]
@@ -0,0 +1,13 @@
+import pytest
+
+from src.infrastructure.db.base import Base
+from src.infrastructure.db.models import order_model  # noqa: F401  (registers the tables)
+
+
+@pytest.mark.parametrize("table", list(Base.metadata.tables.values()), ids=lambda table: table.name)
+def test_every_foreign_key_has_a_leading_index(table):
+    """Test that each FK column leads an index, so cascades and joins do not scan the child table"""
+    leading_columns = {next(iter(index.expressions)) for index in table.indexes}
+    
+    for foreign_key in table.foreign_keys:
+        assert foreign_key.parent in leading_columns, f"{foreign_key.parent} is not indexed"
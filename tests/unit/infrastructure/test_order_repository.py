@@ -1,49 +1,129 @@
 import pytest
+import random
 import uuid
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch, call
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_item import OrderItem
 from src.domain.value_objects.delivery_address import DeliveryAddress
 from src.domain.value_objects.order_total import OrderTotal
-from src.infrastructure.db.models.order_model import OrderModel, OrderItemModel, CustomerModel
+from src.infrastructure.db.models.order_model import OrderModel, OrderItemModel
 from src.infrastructure.adapters.output.repositories.order_repository import OrderRepository
 
 
-@pytest.fixture
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
+class _ResultStub:
+    """Plain stand-in for a Result whose scalars().first() is fixed"""
+    
+    def __init__(self, first):
+        self._first = first
+    
+    def scalars(self):
+        return self
+    
+    def first(self):
+        return self._first
+
+
+class _FakeSession:
+    """Stand-in for AsyncSession carrying only the methods the repository calls"""
+    
+    def __init__(self):
+        self.add = MagicMock()
+        self.add_all = MagicMock()
+        self.expunge_all = MagicMock()
+        self.execute = AsyncMock()
+        self.stream = AsyncMock()
+        self.commit = AsyncMock()
+        self.delete = AsyncMock()
+        self.rollback = AsyncMock()
+        self.refresh = AsyncMock()
+
+
+def order_rows(order_model, item_models):
+    """Build the order/item join rows returned by the bulk finders"""
+    order_columns = {
+        "id": order_model.id,
+        "customer_id": order_model.customer_id,
+        "status": order_model.status,
+        "notes": order_model.notes,
+        "created_at": order_model.created_at,
+        "updated_at": order_model.updated_at,
+        "delivery_address": order_model.delivery_address,
+        "total": order_model.total
+    }
+    if not item_models:
+        return [SimpleNamespace(**order_columns, item_id=None)]
+    return [
+        SimpleNamespace(
+            **order_columns,
+            item_id=item_model.id,
+            item_product_id=item_model.product_id,
+            item_name=item_model.name,
+            item_quantity=item_model.quantity,
+            item_unit_price=item_model.unit_price,
+            item_total_price=item_model.total_price,
+            item_notes=item_model.notes,
+            item_created_at=item_model.created_at
+        )
+        for item_model in item_models
+    ]
+
+
+# Fixed timestamp for every entity and model built by this module
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Bounds of a date range containing every order built by the fixtures
+_RANGE_START = _NOW - timedelta(days=1)
+_RANGE_END = _NOW + timedelta(days=1)
+
+# Seeded source of UUIDs, so identifiers are stable between runs and need no os.urandom
+_RNG = random.Random(42)
+
+
+def _uid():
+    return uuid.UUID(int=_RNG.getrandbits(128), version=4)
+
+
+# Unbound bulk finders, resolved once for the parametrized dispatch below
+_FINDERS = {
+    name: getattr(OrderRepository, name)
+    for name in ("find_by_customer_id", "find_by_status", "find_by_date_range")
+}
+
+
+@pytest.fixture(scope="module")
 def order_id():
-    return uuid.uuid4()
+    return _uid()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def customer_id():
-    return uuid.uuid4()
+    return _uid()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def item_id():
-    return uuid.uuid4()
+    return _uid()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def product_id():
-    return uuid.uuid4()
+    return _uid()
 
 
 @pytest.fixture
 def mock_session():
-    session = AsyncMock(spec=AsyncSession)
-    session.execute = AsyncMock()
-    session.commit = AsyncMock()
-    session.delete = AsyncMock()
-    return session
+    return _FakeSession()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def delivery_address():
     return DeliveryAddress(
         street="123 Main St",
@@ -54,7 +134,8 @@ def delivery_address():
     )
 
 
-@pytest.fixture
+# The repository never mutates the entities it is given, so they can be shared
+@pytest.fixture(scope="module")
 def order_item(item_id, product_id):
     return OrderItem(
         id=item_id,
@@ -64,11 +145,11 @@ def order_item(item_id, product_id):
         unit_price=10.0,
         total_price=20.0,
         notes="Test notes",
-        created_at=datetime.now()
+        created_at=_NOW
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def order(order_id, customer_id, order_item, delivery_address):
     return Order(
         id=order_id,
@@ -78,18 +159,19 @@ def order(order_id, customer_id, order_item, delivery_address):
         delivery_address=delivery_address,
         total=OrderTotal(subtotal=20.0, tax=2.0, total=22.0),
         notes="Test order notes",
-        created_at=datetime.now()
+        created_at=_NOW
     )
 
 
-@pytest.fixture
-def order_model(order_id, customer_id):
-    return OrderModel(
+# The repository only reads the models it converts, so one order/item pair is shared by the module
+@pytest.fixture(scope="module")
+def model_pair(order_id, customer_id, item_id, product_id):
+    order_model = OrderModel(
         id=order_id,
         customer_id=customer_id,
         status=OrderStatus.CREATED.value,
         notes="Test order notes",
-        created_at=datetime.now(),
+        created_at=_NOW,
         delivery_address={
             "street": "123 Main St",
             "city": "Test City",
@@ -103,11 +185,7 @@ def order_model(order_id, customer_id):
             "total": 22.0
         }
     )
-
-
-@pytest.fixture
-def order_item_model(order_id, item_id, product_id):
-    return OrderItemModel(
+    order_item_model = OrderItemModel(
         id=item_id,
         order_id=order_id,
         product_id=product_id,
@@ -116,8 +194,31 @@ def order_item_model(order_id, item_id, product_id):
         unit_price=10.0,
         total_price=20.0,
         notes="Test notes",
-        created_at=datetime.now()
+        created_at=_NOW
     )
+    order_model.items = [order_item_model]
+    return order_model, order_item_model
+
+
+@pytest.fixture(scope="module")
+def order_model(model_pair):
+    return model_pair[0]
+
+
+@pytest.fixture(scope="module")
+def order_item_model(model_pair):
+    return model_pair[1]
+
+
+@pytest.fixture
+def scalar_result(mock_session):
+    """Make the next session.execute() return a result whose scalars().first() is the given value"""
+    def set_first(first):
+        result = _ResultStub(first)
+        mock_session.execute.return_value = result
+        return result
+    
+    return set_first
 
 
 @pytest.fixture
@@ -125,7 +226,6 @@ def order_repository(mock_session):
     return OrderRepository(mock_session)
 
 
-@pytest.mark.asyncio
 async def test_save_order(order_repository, mock_session, order):
     # Setup
     # Execute
@@ -133,18 +233,17 @@ async def test_save_order(order_repository, mock_session, order):
     
     # Assert
     assert result == order
-    mock_session.add.assert_called()
+    mock_session.add.assert_called_once()
+    item_models = mock_session.add_all.call_args.args[0]
+    assert [item_model.id for item_model in item_models] == [item.id for item in order.items]
     mock_session.commit.assert_called_once()
+    mock_session.expunge_all.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_find_by_id(order_repository, mock_session, order_model, order_item_model, order_id):
+async def test_find_by_id(order_repository, mock_session, order_model, order_item_model, order_id, scalar_result):
     
     # Setup
-    order_model.items = [order_item_model]
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = order_model
-    mock_session.execute.return_value = mock_result
+    scalar_result(order_model)
     
     # Execute
     result = await order_repository.find_by_id(order_id)
@@ -157,12 +256,9 @@ async def test_find_by_id(order_repository, mock_session, order_model, order_ite
     mock_session.execute.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_find_by_id_not_found(order_repository, mock_session, order_id):
+async def test_find_by_id_not_found(order_repository, mock_session, order_id, scalar_result):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = None
-    mock_session.execute.return_value = mock_result
+    scalar_result(None)
     
     # Execute
     result = await order_repository.find_by_id(order_id)
@@ -172,88 +268,102 @@ async def test_find_by_id_not_found(order_repository, mock_session, order_id):
     mock_session.execute.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_find_by_customer_id(order_repository, mock_session, order_model, order_item_model, customer_id):
+@pytest.mark.parametrize(
+    "method_name, build_args",
+    [
+        ("find_by_customer_id", lambda order_model: (order_model.customer_id,)),
+        ("find_by_status", lambda order_model: (OrderStatus.CREATED,)),
+        ("find_by_date_range", lambda order_model: (_RANGE_START, _RANGE_END)),
+        ("find_by_date_range", lambda order_model: (_RANGE_START, _RANGE_END, OrderStatus.CREATED))
+    ],
+    ids=["customer_id", "status", "date_range", "date_range_with_status"]
+)
+async def test_bulk_finders(order_repository, mock_session, order_model, order_item_model, method_name, build_args):
     # Setup
-    order_model.items = [order_item_model]
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [order_model]
-    mock_session.execute.return_value = mock_result
+    mock_session.stream.return_value = async_iter(order_rows(order_model, [order_item_model]))
     
     # Execute
-    result = await order_repository.find_by_customer_id(customer_id)
+    result = [order async for order in _FINDERS[method_name](order_repository, *build_args(order_model))]
     
     # Assert
-    assert result is not None
     assert len(result) == 1
-    assert result[0].customer_id == customer_id
-    mock_session.execute.assert_called_once()
+    assert result[0].id == order_model.id
+    assert result[0].customer_id == order_model.customer_id
+    assert result[0].status == OrderStatus.CREATED
+    mock_session.stream.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_find_by_status(order_repository, mock_session, order_model, order_item_model):
+async def test_find_by_customer_id_applies_keyset_cursor(order_repository, mock_session, customer_id):
     # Setup
-    order_model.items = [order_item_model]
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [order_model]
-    mock_session.execute.return_value = mock_result
+    mock_session.stream.return_value = async_iter([])
+    cursor = (datetime(2024, 1, 1), _uid())
     
     # Execute
-    result = await order_repository.find_by_status(OrderStatus.CREATED)
+    result = [order async for order in order_repository.find_by_customer_id(customer_id, limit=10, cursor=cursor)]
     
     # Assert
-    assert result is not None
-    assert len(result) == 1
-    assert result[0].status == OrderStatus.CREATED
-    mock_session.execute.assert_called_once()
+    assert result == []
+    sql = str(mock_session.stream.call_args.args[0])
+    assert "ORDER BY order_service.orders.created_at DESC, order_service.orders.id DESC" in sql
+    assert "(order_service.orders.created_at, order_service.orders.id) <" in sql
+    assert "LIMIT" in sql
 
 
-@pytest.mark.asyncio
-async def test_find_by_date_range(order_repository, mock_session, order_model, order_item_model):
+async def test_find_by_date_range_pages_forward(order_repository, mock_session):
     # Setup
-    start_date = datetime.now() - timedelta(days=1)
-    end_date = datetime.now() + timedelta(days=1)
-    order_model.items = [order_item_model]
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [order_model]
-    mock_session.execute.return_value = mock_result
+    mock_session.stream.return_value = async_iter([])
+    cursor = (_NOW, _uid())
     
     # Execute
-    result = await order_repository.find_by_date_range(start_date, end_date)
+    result = [
+        order async for order in order_repository.find_by_date_range(_RANGE_START, _RANGE_END, limit=10, cursor=cursor)
+    ]
     
     # Assert
-    assert result is not None
-    assert len(result) == 1
-    mock_session.execute.assert_called_once()
+    assert result == []
+    sql = str(mock_session.stream.call_args.args[0])
+    assert "ORDER BY order_service.orders.created_at, order_service.orders.id" in sql
+    assert "(order_service.orders.created_at, order_service.orders.id) >" in sql
+    assert "LIMIT" in sql
 
 
-@pytest.mark.asyncio
-async def test_find_by_date_range_with_status(order_repository, mock_session, order_model, order_item_model):
+async def test_bulk_finders_group_join_rows_by_order(
+    order_repository, mock_session, order_model, order_item_model, customer_id
+):
     # Setup
-    start_date = datetime.now() - timedelta(days=1)
-    end_date = datetime.now() + timedelta(days=1)
-    status = OrderStatus.CREATED
-    order_model.items = [order_item_model]
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [order_model]
-    mock_session.execute.return_value = mock_result
+    second_item_model = OrderItemModel(
+        id=_uid(),
+        order_id=order_model.id,
+        product_id=_uid(),
+        name="Second Product",
+        quantity=1,
+        unit_price=5.0,
+        total_price=5.0,
+        created_at=_NOW
+    )
+    empty_order_model = OrderModel(
+        id=_uid(),
+        customer_id=customer_id,
+        status=OrderStatus.PENDING.value,
+        created_at=_NOW,
+        total={"subtotal": 0, "tax": 0, "total": 0}
+    )
+    rows = order_rows(order_model, [order_item_model, second_item_model]) + order_rows(empty_order_model, [])
+    mock_session.stream.return_value = async_iter(rows)
     
     # Execute
-    result = await order_repository.find_by_date_range(start_date, end_date, status)
+    result = [order async for order in order_repository.find_by_customer_id(customer_id)]
     
     # Assert
-    assert result is not None
-    assert len(result) == 1
-    mock_session.execute.assert_called_once()
+    assert [order.id for order in result] == [order_model.id, empty_order_model.id]
+    assert [item.name for item in result[0].items] == ["Test Product", "Second Product"]
+    assert result[1].items == []
+    assert result[1].delivery_address is None
 
 
-@pytest.mark.asyncio
-async def test_update(order_repository, mock_session, order, order_model, order_item_model, order_id):
+async def test_update(order_repository, mock_session, order, order_model, order_item_model, order_id, scalar_result):
     # Setup
-    order_model.items = [order_item_model]
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = order_model
-    mock_session.execute.return_value = mock_result
+    scalar_result(order_model)
     
     # Execute
     result = await order_repository.update(order)
@@ -264,12 +374,24 @@ async def test_update(order_repository, mock_session, order, order_model, order_
     mock_session.commit.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_update_not_found(order_repository, mock_session, order, order_id):
+async def test_update_uses_bulk_statements(order_repository, mock_session, order, scalar_result):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = None
-    mock_session.execute.return_value = mock_result
+    scalar_result(order.id)
+    
+    # Execute
+    await order_repository.update(order)
+    
+    # Assert: order UPDATE, stale item DELETE and item upsert, regardless of item count
+    statements = [c.args[0] for c in mock_session.execute.call_args_list]
+    assert [statement.is_update for statement in statements] == [True, False, False]
+    assert [statement.is_delete for statement in statements] == [False, True, False]
+    assert statements[2].is_insert
+    mock_session.commit.assert_called_once()
+
+
+async def test_update_not_found(order_repository, mock_session, order, order_id, scalar_result):
+    # Setup
+    scalar_result(None)
     
     # Execute and Assert
     with pytest.raises(ValueError):
@@ -278,12 +400,9 @@ async def test_update_not_found(order_repository, mock_session, order, order_id)
     mock_session.commit.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_delete(order_repository, mock_session, order_model, order_id):
+async def test_delete(order_repository, mock_session, order_model, order_id, scalar_result):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = order_model
-    mock_session.execute.return_value = mock_result
+    scalar_result(order_model)
     
     # Execute
     await order_repository.delete(order_id)
@@ -293,24 +412,9 @@ async def test_delete(order_repository, mock_session, order_model, order_id):
     mock_session.commit.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_delete_order_not_found(order_repository, mock_session, order_id):
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = None
-    mock_session.execute.return_value = mock_result
-
-    await order_repository.delete(order_id)
-
-    mock_session.delete.assert_not_called()
-    mock_session.commit.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_delete_not_found(order_repository, mock_session, order_id):
+async def test_delete_not_found(order_repository, mock_session, order_id, scalar_result):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = None
-    mock_session.execute.return_value = mock_result
+    scalar_result(None)
     
     # Execute
     await order_repository.delete(order_id)
@@ -320,11 +424,7 @@ async def test_delete_not_found(order_repository, mock_session, order_id):
     mock_session.commit.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_model_to_entity_conversion(order_repository, order_model, order_item_model):
-    # Setup
-    order_model.items = [order_item_model]
-    
     # Execute
     result = order_repository._model_to_entity(order_model)
     
@@ -0,0 +1,62 @@
+import pytest
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from redis.exceptions import RedisError
+
+from src.infrastructure.adapters.output.cache.redis_order_cache import RedisOrderCache
+
+
+@pytest.fixture
+def order_cache():
+    settings = SimpleNamespace(REDIS_URL="redis://localhost:6379/0", ORDER_CACHE_TTL=300)
+    cache = RedisOrderCache(settings)
+    cache.client = AsyncMock()
+    return cache
+
+
+async def test_set_and_get_order(order_cache):
+    # Setup
+    order_id = uuid.uuid4()
+    
+    # Execute
+    await order_cache.set_order(order_id, {"id": order_id, "status": "CREATED"})
+    key, raw = order_cache.client.set.call_args.args
+    order_cache.client.get.return_value = raw
+    result = await order_cache.get_order(order_id)
+    
+    # Assert
+    assert key == f"order:{order_id}"
+    assert order_cache.client.set.call_args.kwargs == {"ex": 300}
+    assert result == {"id": str(order_id), "status": "CREATED"}
+
+
+async def test_invalidate_drops_order_and_customer_entries(order_cache):
+    # Setup
+    order_id = uuid.uuid4()
+    customer_id = uuid.uuid4()
+    
+    # Execute
+    await order_cache.invalidate(order_id, customer_id)
+    
+    # Assert
+    order_cache.client.delete.assert_called_once_with(f"order:{order_id}", f"customer:{customer_id}:orders")
+
+
+async def test_redis_errors_are_cache_misses(order_cache):
+    # Setup
+    order_cache.client.get.side_effect = RedisError("down")
+    
+    # Execute and Assert
+    assert await order_cache.get_customer_orders(uuid.uuid4()) is None
+
+
+async def test_cache_disabled_without_client(order_cache):
+    # Setup
+    order_cache.client = None
+    
+    # Execute and Assert
+    assert await order_cache.get_order(uuid.uuid4()) is None
+    await order_cache.set_order(uuid.uuid4(), {})
+    await order_cache.invalidate(uuid.uuid4(), uuid.uuid4())